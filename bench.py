@@ -0,0 +1,276 @@
+"""
+Reproducible benchmark suite for the River Crossing Problem solvers.
+
+Runs every selected algorithm over a grid of problem sizes with warmup and
+repeated timed runs (measured with time.perf_counter_ns), reports the median,
+p95 and p99 per cell, writes the results as JSON or CSV, and optionally
+compares them against a stored baseline so regressions are visible.
+
+Examples:
+    python bench.py
+    python bench.py --sizes 3,3,2 100,100,4 --algorithms BFS A* --repeat 50
+    python bench.py --format csv --output bench.csv
+    python bench.py --save-baseline baseline.json
+    python bench.py --baseline baseline.json --threshold 1.2
+    python bench.py --startup main --startup-budget 80
+    python bench.py --algorithms Greedy --sizes 200,100,2 1000,500,2 --memory
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from search.registry import (HEURISTIC_ALGORITHMS, HEURISTIC_NAMES, SOLVER_MODULES, SOLVER_OPTIONS,
+                             get_solver, parse_size)
+
+from core.river_crossing import Problem
+
+DEFAULT_SIZES = ["3,3,2", "20,20,4", "100,100,4"]
+
+# Entry points whose cold import time --startup measures by default
+STARTUP_MODULES = ["main"]
+DEFAULT_STARTUP_BUDGET_MS = 100.0
+
+CSV_FIELDS = ["algorithm", "m", "c", "capacity", "heuristic", "frontier", "path_length", "nodes",
+              "runs", "min_ms", "mean_ms", "median_ms", "p95_ms", "p99_ms", "peak_kib", "error"]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def peak_memory_kib(solver, problem: Problem, kwargs: Dict) -> float:
+    """
+    Peak Python heap allocated during one solve, via tracemalloc. Run after
+    the warmup so shared cached tables are not counted.
+    """
+    tracemalloc.start()
+    try:
+        solver(problem, **kwargs)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def bench_cell(name: str, problem: Problem, heuristic: Optional[str],
+               warmup: int, repeat: int, memory: bool = False,
+               frontier: Optional[str] = None) -> Dict:
+    """
+    Time one (algorithm, problem) cell and summarise its run times. With
+    `memory`, one extra untimed run records the peak heap usage.
+    """
+    # Import outside the timed region
+    solver = get_solver(name).load()
+    kwargs = {"heuristic": heuristic} if heuristic and name in HEURISTIC_ALGORITHMS else {}
+    if frontier and "frontier" in SOLVER_OPTIONS.get(name, ()):
+        kwargs["frontier"] = frontier
+
+    record = {
+        "algorithm": name,
+        "m": problem.n_missionaries,
+        "c": problem.n_cannibals,
+        "capacity": problem.boat_capacity,
+        "heuristic": kwargs.get("heuristic", ""),
+        "frontier": kwargs.get("frontier", ""),
+    }
+
+    try:
+        # Warmup also builds the cached transition index / heuristic tables
+        for _ in range(warmup):
+            solver(problem, **kwargs)
+
+        samples_ms = []
+        for _ in range(repeat):
+            t0 = time.perf_counter_ns()
+            path, nodes, _ = solver(problem, **kwargs)
+            samples_ms.append((time.perf_counter_ns() - t0) / 1e6)
+        if memory:
+            record["peak_kib"] = peak_memory_kib(solver, problem, kwargs)
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+        return record
+
+    samples_ms.sort()
+    record.update({
+        "path_length": len(path) - 1 if path else None,
+        "nodes": nodes,
+        "runs": repeat,
+        "min_ms": samples_ms[0],
+        "mean_ms": statistics.fmean(samples_ms),
+        "median_ms": statistics.median(samples_ms),
+        "p95_ms": percentile(samples_ms, 95),
+        "p99_ms": percentile(samples_ms, 99),
+    })
+    return record
+
+
+def import_time_ms(module: str) -> float:
+    """
+    Cumulative import time of `module` in a fresh interpreter, as reported
+    by `python -X importtime` (so interpreter startup itself is excluded).
+    """
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                               cwd=os.path.dirname(os.path.abspath(__file__)),
+                               capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{completed.stderr.strip()}")
+
+    # Lines look like "import time:  self [us] | cumulative | imported package"
+    for line in reversed(completed.stderr.splitlines()):
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1000
+    raise RuntimeError(f"no importtime entry for {module}")
+
+
+def bench_startup(modules: List[str], repeat: int, budget_ms: float) -> int:
+    """Print the median cold import time per module; returns the number over budget."""
+    print(f"{'Module':<14} | {'Median ms':>10} | {'Budget ms':>10}")
+    print("-" * 42)
+
+    over_budget = 0
+    for module in modules:
+        import_time_ms(module)  # Warmup: compile and cache the .pyc files
+        median = statistics.median(import_time_ms(module) for _ in range(repeat))
+        flag = ""
+        if median > budget_ms:
+            over_budget += 1
+            flag = "  OVER BUDGET"
+        print(f"{module:<14} | {median:>10.2f} | {budget_ms:>10.2f}{flag}")
+
+    return over_budget
+
+
+def cell_key(record: Dict) -> tuple:
+    return (record["algorithm"], record["m"], record["c"], record["capacity"], record["heuristic"],
+            record.get("frontier", ""))
+
+
+def compare_with_baseline(results: List[Dict], baseline: Dict, threshold: float) -> int:
+    """
+    Print median ratios against the baseline and return the number of cells
+    slower than `threshold` x baseline.
+    """
+    previous = {cell_key(r): r for r in baseline["results"] if "median_ms" in r}
+
+    print(f"\n{'Algorithm':<14} | {'Instance':<14} | {'Baseline ms':>12} | {'Now ms':>10} | {'Ratio':>6}")
+    print("-" * 70)
+
+    regressions = 0
+    for record in results:
+        old = previous.get(cell_key(record))
+        if old is None or "median_ms" not in record:
+            continue
+        ratio = record["median_ms"] / old["median_ms"] if old["median_ms"] else float("inf")
+        flag = ""
+        if ratio > threshold:
+            regressions += 1
+            flag = "  REGRESSION"
+        instance = f"{record['m']}/{record['c']}/{record['capacity']}"
+        print(f"{record['algorithm']:<14} | {instance:<14} | {old['median_ms']:>12.3f} | "
+              f"{record['median_ms']:>10.3f} | {ratio:>6.2f}{flag}")
+
+    return regressions
+
+
+def write_results(results: List[Dict], meta: Dict, fmt: str, output: Optional[str]) -> None:
+    out = open(output, "w", newline="") if output else sys.stdout
+    try:
+        if fmt == "json":
+            json.dump({"meta": meta, "results": results}, out, indent=2)
+            out.write("\n")
+        else:
+            writer = csv.DictWriter(out, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            for record in results:
+                writer.writerow(record)
+    finally:
+        if output:
+            out.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark the River Crossing Problem solvers.")
+    parser.add_argument("--algorithms", nargs="+", default=list(SOLVER_MODULES), choices=list(SOLVER_MODULES),
+                        metavar="ALGO", help=f"algorithms to run (default: all of {', '.join(SOLVER_MODULES)})")
+    parser.add_argument("--sizes", nargs="+", type=parse_size, default=[parse_size(s) for s in DEFAULT_SIZES],
+                        metavar="M,C,CAPACITY", help=f"problem instances (default: {' '.join(DEFAULT_SIZES)})")
+    parser.add_argument("--heuristic", choices=HEURISTIC_NAMES, default=None,
+                        help="heuristic for A*, Greedy and IDA*")
+    parser.add_argument("--frontier", choices=["heap", "bucket"], default=None,
+                        help="priority queue for A* and Greedy (default: each solver's own)")
+    parser.add_argument("--warmup", type=int, default=3, help="untimed runs per cell (default: 3)")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per cell (default: 20)")
+    parser.add_argument("--memory", action="store_true",
+                        help="also record each cell's peak heap usage (one extra tracemalloc run)")
+    parser.add_argument("--format", choices=["json", "csv"], default="json", help="output format")
+    parser.add_argument("--output", help="write results here instead of stdout")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=1.10,
+                        help="median ratio above which a cell counts as a regression (default: 1.10)")
+    parser.add_argument("--save-baseline", metavar="PATH", help="also save these results as a JSON baseline")
+    parser.add_argument("--startup", nargs="*", metavar="MODULE",
+                        help="instead of solving, time the cold import of these modules "
+                             f"(default: {' '.join(STARTUP_MODULES)})")
+    parser.add_argument("--startup-budget", type=float, default=DEFAULT_STARTUP_BUDGET_MS, metavar="MS",
+                        help=f"fail if a median import time exceeds this (default: {DEFAULT_STARTUP_BUDGET_MS:g})")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.repeat < 1:
+        print("--repeat must be at least 1", file=sys.stderr)
+        return 2
+
+    if args.startup is not None:
+        over_budget = bench_startup(args.startup or STARTUP_MODULES, args.repeat, args.startup_budget)
+        if over_budget:
+            print(f"\n{over_budget} module(s) above the {args.startup_budget:g} ms startup budget", file=sys.stderr)
+            return 1
+        return 0
+
+    meta = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "warmup": args.warmup,
+        "repeat": args.repeat,
+        "timer": "perf_counter_ns",
+        "memory": args.memory,
+    }
+
+    results = []
+    for problem in args.sizes:
+        for name in args.algorithms:
+            print(f"Benchmarking {name} on {problem!r}...", file=sys.stderr)
+            results.append(bench_cell(name, problem, args.heuristic, args.warmup, args.repeat, args.memory,
+                                      args.frontier))
+
+    write_results(results, meta, args.format, args.output)
+
+    if args.save_baseline:
+        write_results(results, meta, "json", args.save_baseline)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{regressions} regression(s) above {args.threshold:.2f}x baseline", file=sys.stderr)
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
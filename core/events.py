@@ -0,0 +1,43 @@
+# core/events.py
+"""
+Expansion events yielded by the `search_iter` generators in `search/`.
+
+Every solver module offers `search_iter(problem, ...)` next to `solve`. It
+runs the same search but yields one `Expansion` per expanded state, lazily,
+so callers can stop early, sample progress or animate the exploration
+without buffering a trace. When the search ends the generator returns the
+solution path (or [] if there is none) as its `StopIteration` value;
+`run_events` collects it.
+"""
+
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from core.river_crossing import State
+
+
+class Expansion(NamedTuple):
+    """One expanded state."""
+
+    state: State
+    depth: int          # moves from the root of the search that expanded it
+    frontier_size: int  # states (or open levels, for depth-first solvers) still pending
+
+
+def run_events(events: Iterator[Expansion], limit: Optional[int] = None) -> Tuple[List[State], int]:
+    """
+    Drive a `search_iter` generator to completion, or until `limit` events.
+
+    Returns:
+        tuple: (path, expansions) — path is [] if no solution was found or
+            the limit stopped the search first.
+    """
+    expansions = 0
+    while limit is None or expansions < limit:
+        try:
+            next(events)
+        except StopIteration as stop:
+            return stop.value or [], expansions
+        expansions += 1
+
+    events.close()
+    return [], expansions
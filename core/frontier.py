@@ -0,0 +1,115 @@
+# core/frontier.py
+"""
+Bucketed priority queue for the best-first solvers (A* and Greedy).
+
+Path costs are unit integers and every heuristic in core.heuristics is a
+multiple of 1 / boat_capacity, so priorities scaled by the capacity are
+small exact integers: A* files a state under f = (g + h) * capacity and
+Greedy under h * capacity. `integer_key` rounds up anything finer, which
+keeps an admissible (or consistent) heuristic admissible (or consistent)
+because true distances are integers.
+
+`BucketQueue` keeps one bucket per f and, inside it, one ordered set per
+g. Push and pop are O(1) apart from skipping empty buckets, which is
+amortised: the lowest f only moves up as far as the largest f pushed, and
+the highest g of a bucket only moves down as far as it was pushed up.
+Re-pushing a queued state moves it to its new bucket (decrease-key), so
+unlike the binary heap the queue never holds stale duplicates and needs no
+visited check on pop.
+
+Among equal f the queue pops the largest g first (the state closest to
+the goal for A*), then the most recently pushed state.
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+from core.river_crossing import State
+
+# Frontier names accepted by `frontier=` in search.astar and search.greedy
+FRONTIERS = ("heap", "bucket")
+
+
+def check_frontier(name: str) -> None:
+    if name not in FRONTIERS:
+        raise ValueError(f"Unknown frontier '{name}'. Choose from: {', '.join(FRONTIERS)}")
+
+
+def integer_key(value: float, scale: int) -> int:
+    """ceil(value * scale), exact for multiples of 1 / scale despite float noise."""
+    return math.ceil(value * scale - 1e-9)
+
+
+class BucketQueue:
+    """Integer-keyed priority queue of states with decrease-key."""
+
+    def __init__(self):
+        # f -> {g -> ordered set of states}; empty g sets are dropped
+        self._buckets: List[Dict[int, Dict[State, None]]] = []
+        # f -> highest g that may be non-empty (-1 for an empty bucket)
+        self._top_g: List[int] = []
+        self._keys: Dict[State, Tuple[int, int]] = {}
+        self._min_f = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, state: State) -> bool:
+        return state in self._keys
+
+    def key(self, state: State) -> Optional[Tuple[int, int]]:
+        """The (f, g) a queued state is filed under, or None."""
+        return self._keys.get(state)
+
+    def push(self, state: State, f: int, g: int = 0) -> None:
+        """Queue `state` under (f, g), moving it if it is already queued."""
+        old = self._keys.get(state)
+        if old is not None:
+            self._discard(state, *old)
+
+        buckets = self._buckets
+        if f >= len(buckets):
+            grow = f + 1 - len(buckets)
+            buckets.extend({} for _ in range(grow))
+            self._top_g.extend([-1] * grow)
+        bucket = buckets[f]
+        if g in bucket:
+            bucket[g][state] = None
+        else:
+            bucket[g] = {state: None}
+            if g > self._top_g[f]:
+                self._top_g[f] = g
+
+        self._keys[state] = (f, g)
+        if f < self._min_f:
+            self._min_f = f
+
+    def pop(self) -> Tuple[State, int, int]:
+        """Remove and return (state, f, g) with the lowest f, then highest g."""
+        if not self._keys:
+            raise IndexError("pop from an empty BucketQueue")
+
+        buckets = self._buckets
+        f = self._min_f
+        while not buckets[f]:
+            f += 1
+        self._min_f = f
+
+        bucket = buckets[f]
+        g = self._top_g[f]
+        while g not in bucket:
+            g -= 1
+        states = bucket[g]
+        state, _ = states.popitem()
+        if not states:
+            del bucket[g]
+        self._top_g[f] = g if bucket else -1
+
+        del self._keys[state]
+        return state, f, g
+
+    def _discard(self, state: State, f: int, g: int) -> None:
+        states = self._buckets[f][g]
+        del states[state]
+        if not states:
+            del self._buckets[f][g]
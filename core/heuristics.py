@@ -0,0 +1,71 @@
+# core/heuristics.py
+"""
+Selectable admissible heuristics for A*, Greedy and IDA*.
+
+  - "simple":   (M_L + C_L) / capacity — `Problem.heuristic`
+  - "capacity": boat-position-aware trip count, served from a lookup table
+  - "pdb":      exact distance-to-goal from the pattern database (core.pattern_db)
+
+Capacity-aware bound, with n = M_L + C_L people still on the left bank and
+boat capacity k: every round trip nets at most k - 1 people, and the last
+crossing carries up to k. So with the boat on the left bank,
+
+    h = max(1, 2 * ceil((n - 1) / (k - 1)) - 1)          (n > 0)
+
+and with the boat on the right someone has to bring it back first,
+
+    h = 2 * ceil(n / (k - 1))                            (n > 0)
+
+Both are 0 when n = 0 (the boat can only be on the right once everyone has
+crossed). The bound changes by at most one per crossing, so it is consistent
+as well as admissible.
+"""
+
+from array import array
+from functools import lru_cache
+import math
+from typing import Callable
+
+from core.river_crossing import Problem, State
+from core.pattern_db import UNREACHABLE, get_pattern_db
+
+HEURISTICS = ("simple", "capacity", "pdb")
+
+Heuristic = Callable[[State], float]
+
+
+@lru_cache(maxsize=16)
+def capacity_table(problem: Problem) -> array:
+    """
+    Precomputed capacity-aware bound, indexed by (M_L + C_L) * 2 + boat.
+    """
+    # With k = 1 nobody can ever be ferried for good; any bound is admissible
+    net = max(problem.boat_capacity - 1, 1)
+    total = problem.n_missionaries + problem.n_cannibals
+
+    table = array('i', [0]) * ((total + 1) * 2)
+    for n in range(1, total + 1):
+        table[n * 2 + 1] = max(1, 2 * (-(-(n - 1) // net)) - 1)  # boat on left
+        table[n * 2] = 2 * (-(-n // net))                       # boat on right
+    return table
+
+
+def get_heuristic(problem: Problem, name: str = "simple") -> Heuristic:
+    """
+    Return the heuristic called `name` for `problem` as a state -> value function.
+    """
+    if name == "simple":
+        return problem.heuristic
+    if name == "capacity":
+        table = capacity_table(problem)
+        return lambda state: table[(state[0] + state[1]) * 2 + state[2]]
+    if name == "pdb":
+        distances = get_pattern_db(problem)
+        stride = problem.n_cannibals + 1
+
+        def pdb(state: State) -> float:
+            distance = distances[(state[0] * stride + state[1]) * 2 + state[2]]
+            return math.inf if distance == UNREACHABLE else distance
+
+        return pdb
+    raise ValueError(f"Unknown heuristic '{name}'. Choose from: {', '.join(HEURISTICS)}")
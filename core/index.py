@@ -0,0 +1,119 @@
+# core/index.py
+"""
+Precomputed transition index shared by all solvers.
+
+For a problem instance the valid-transition adjacency is computed once and
+stored two ways:
+  - CSR arrays over packed state indices: the successors of idx are
+    targets[offsets[idx]:offsets[idx + 1]]
+  - a dict mapping each valid state tuple to a tuple of successor tuples
+
+Both are filled lazily: the dict one state at a time as solvers ask for it,
+the CSR arrays in one pass on first use. A one-shot solve (e.g. from a batch
+over thousands of instances) therefore only pays for the states it visits.
+
+Successors are kept in move-table order, so solvers expand states in exactly
+the same order as `Problem.get_successors`. Indices are cached per
+(M, C, capacity) via `get_index`.
+"""
+
+from array import array
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Tuple
+
+from core.river_crossing import Problem, State
+
+EMPTY: Tuple[State, ...] = ()
+
+
+def iter_valid_states(problem: Problem) -> Iterator[State]:
+    """
+    Enumerate every safe state without testing the whole (M+1)x(C+1)x2 grid.
+
+    For a given M_L the safe C_L values form one contiguous range:
+      - left bank safe:  M_L == 0 or C_L <= M_L
+      - right bank safe: M_L == M or C - C_L <= M - M_L
+    """
+    M, C = problem.n_missionaries, problem.n_cannibals
+    for m in range(M + 1):
+        lo = 0 if m == M else max(0, C - M + m)
+        hi = C if m == 0 else min(C, m)
+        for c in range(lo, hi + 1):
+            yield (m, c, 0)
+            yield (m, c, 1)
+
+
+class TransitionIndex:
+    """Valid-transition adjacency of one problem instance."""
+
+    def __init__(self, problem: Problem):
+        self.problem = problem
+        self._by_state: Dict[State, Tuple[State, ...]] = {}
+        self._offsets: Optional[array] = None
+        self._targets: Optional[array] = None
+
+    def _build_csr(self) -> None:
+        problem = self.problem
+        num_states = problem.num_states
+        targets = array('i')
+        # Per-state successor counts first, turned into offsets below
+        counts = array('i', [0]) * (num_states + 1)
+
+        adjacency = []
+        for state in iter_valid_states(problem):
+            idx = problem.encode(state)
+            successors = problem.get_successor_indices(idx)
+            counts[idx + 1] = len(successors)
+            adjacency.append((idx, successors))
+
+        # Prefix sums → CSR offsets; adjacency is filled in index order
+        for i in range(num_states):
+            counts[i + 1] += counts[i]
+        adjacency.sort()
+        for _, successors in adjacency:
+            targets.extend(successors)
+
+        self._offsets = counts
+        self._targets = targets
+
+    @property
+    def offsets(self) -> array:
+        if self._offsets is None:
+            self._build_csr()
+        return self._offsets
+
+    @property
+    def targets(self) -> array:
+        if self._targets is None:
+            self._build_csr()
+        return self._targets
+
+    @property
+    def num_valid_states(self) -> int:
+        return sum(1 for _ in iter_valid_states(self.problem))
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    def successors(self, state: State) -> Tuple[State, ...]:
+        """Successor tuples of `state` (empty for invalid states)."""
+        successors = self._by_state.get(state)
+        if successors is None:
+            if self.problem.is_valid_state(state):
+                successors = tuple(self.problem.get_successors(state))
+            else:
+                successors = EMPTY
+            self._by_state[state] = successors
+        return successors
+
+    def successor_indices(self, idx: int) -> array:
+        """Packed successor indices of `idx` as an array slice."""
+        offsets = self.offsets
+        return self.targets[offsets[idx]:offsets[idx + 1]]
+
+
+@lru_cache(maxsize=16)
+def get_index(problem: Problem) -> TransitionIndex:
+    """Build (or fetch the cached) transition index for `problem`."""
+    return TransitionIndex(problem)
@@ -0,0 +1,45 @@
+# core/packed.py
+"""
+Array-backed search tables for the packed integer state encoding.
+
+A state (M_L, C_L, B) maps to idx = (M_L * (C + 1) + C_L) * 2 + B (see
+`Problem.encode`), so per-state bookkeeping can live in flat arrays instead
+of tuple-keyed sets and dicts:
+  - visited flags: one byte per state in a `bytearray`
+  - parent pointers / g-scores: one signed 32-bit int per state in an `array('i')`
+"""
+
+from array import array
+from typing import List
+
+from core.river_crossing import Problem, State
+
+NO_PARENT = -1
+
+
+def new_visited(problem: Problem) -> bytearray:
+    """Zeroed visited table, one byte per packed state."""
+    return bytearray(problem.num_states)
+
+
+def new_int_table(problem: Problem, fill: int = NO_PARENT) -> array:
+    """Int table (parents, g-scores, ...) with every entry set to `fill`."""
+    return array('i', [fill]) * problem.num_states
+
+
+def reconstruct_path(problem: Problem, parents: array, goal_idx: int) -> List[State]:
+    """
+    Follow parent pointers back from `goal_idx` and decode the path.
+    `parents` may be an array('i') or any int sequence (e.g. a NumPy array).
+
+    Returns:
+        list: [initial_state, ..., goal_state]
+    """
+    path = [problem.decode(goal_idx)]
+    current = int(parents[goal_idx])
+    while current != NO_PARENT:
+        path.append(problem.decode(current))
+        current = int(parents[current])
+
+    path.reverse()
+    return path
@@ -0,0 +1,235 @@
+# core/parallel.py
+"""
+Parallel execution of several solvers on one problem instance.
+
+`solve_parallel` dispatches every solver to a ProcessPoolExecutor and yields
+results in completion order, so callers can show each one as soon as it is
+ready. Solvers that exceed `timeout` seconds are reported with a
+`concurrent.futures.TimeoutError` and their worker processes are terminated
+once the comparison is over. ProcessPoolExecutor has no public way to stop
+a running task, so `_terminate_workers` reaches into its private process
+table (a CPython implementation detail); where that table is missing the
+workers are left to finish their current task in the background.
+
+`solve_many` runs one solver over a stream of instances, handing the pool
+chunks of instances so per-task overhead is paid once per chunk and the
+move tables (cached per boat capacity) are reused within each worker.
+
+Solvers must be picklable (module-level functions such as the `solve`
+functions in `search/`, or `search.registry.LazySolver`). When a `cache` is
+given, hits are yielded straight away without touching the pool and fresh
+results are stored on completion, keyed by the solver's `heuristic`
+attribute when it has one.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, TimeoutError, wait
+from itertools import islice
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from core.river_crossing import DEFAULT_PROBLEM, Problem
+from core.solution_cache import Result
+
+# (algorithm name, result or None, error or None)
+Outcome = Tuple[str, Optional[Result], Optional[BaseException]]
+
+# A Problem or its (M, C, capacity) key
+Instance = Union[Problem, Tuple[int, int, int]]
+
+# (problem, result or None, error or None); the raw instance if it is not a valid Problem
+BatchOutcome = Tuple[Instance, Optional[Result], Optional[BaseException]]
+
+DEFAULT_CHUNKSIZE = 64
+
+# How often a waiting solve_parallel checks its cancel event
+CANCEL_POLL_SEC = 0.1
+
+
+def _run(solver: Callable[..., Result], problem: Problem) -> Result:
+    return solver(problem)
+
+
+def solve_parallel(solvers: Dict[str, Callable[..., Result]],
+                   problem: Optional[Problem] = None,
+                   timeout: Optional[float] = None,
+                   max_workers: Optional[int] = None,
+                   cache=None,
+                   cancel: Optional[threading.Event] = None) -> Iterator[Outcome]:
+    """
+    Run every solver on `problem` in its own process and yield
+    (name, result, error) tuples as they finish.
+
+    Args:
+        solvers: Mapping of algorithm name to solver function.
+        problem: Instance to solve (defaults to the classic 3/3/2 one).
+        timeout: Per-solver limit in seconds, counted from submission.
+        max_workers: Pool size; defaults to one process per solver so every
+            solver starts at once. With a smaller pool, time spent queued
+            counts towards `timeout`.
+        cache: Optional SolutionCache/MemoryCache consulted before and
+            filled after solving.
+        cancel: Optional event; once set the generator stops (within
+            CANCEL_POLL_SEC) and the remaining workers are terminated.
+
+    Exactly one of result and error is None in every yielded tuple.
+    """
+    problem = problem or DEFAULT_PROBLEM
+
+    pending = dict(solvers)
+    if cache is not None:
+        for name in list(pending):
+            cached = cache.get(problem, name, getattr(pending[name], "heuristic", None))
+            if cached is not None:
+                del pending[name]
+                yield name, cached, None
+    if not pending:
+        return
+
+    workers = max_workers or len(pending)
+    executor = ProcessPoolExecutor(max_workers=workers)
+    futures: Dict[Future, str] = {}
+    try:
+        for name, solver in pending.items():
+            futures[executor.submit(_run, solver, problem)] = name
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        while futures:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if cancel is not None:
+                remaining = CANCEL_POLL_SEC if remaining is None else min(remaining, CANCEL_POLL_SEC)
+            done, _ = wait(futures, timeout=remaining, return_when=FIRST_COMPLETED)
+
+            if cancel is not None and cancel.is_set():
+                return
+
+            if not done:
+                if deadline is None or time.monotonic() < deadline:
+                    continue
+                # Deadline passed: everything still running is out of time
+                for name in list(futures.values()):
+                    yield name, None, TimeoutError(f"{name} exceeded {timeout:g} s")
+                return
+
+            for future in done:
+                name = futures.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    yield name, None, e
+                    continue
+                if cache is not None:
+                    cache.put(problem, name, getattr(solvers[name], "heuristic", None), result)
+                yield name, result, None
+    finally:
+        # Timed out or abandoned by the caller: running tasks cannot be
+        # cancelled, so stop their processes instead of waiting for them
+        abandoned = any(not future.done() for future in futures)
+        if abandoned:
+            _terminate_workers(executor)
+        executor.shutdown(wait=not abandoned, cancel_futures=True)
+
+
+def _terminate_workers(executor: ProcessPoolExecutor) -> bool:
+    """
+    Terminate the executor's worker processes; returns False if it could
+    not. Relies on the private `_processes` dict of CPython's executor.
+    """
+    processes = getattr(executor, "_processes", None)
+    if not isinstance(processes, dict):
+        return False
+    for process in list(processes.values()):
+        process.terminate()
+    return True
+
+
+def _run_chunk(solver: Callable[..., Result], keys: List[Tuple[int, int, int]],
+               kwargs: Dict) -> List[Tuple[Optional[Result], Optional[BaseException]]]:
+    """Solve a chunk of instances inside a worker; errors are returned, not raised."""
+    outcomes = []
+    for key in keys:
+        try:
+            outcomes.append((solver(Problem(*key), **kwargs), None))
+        except Exception as e:
+            outcomes.append((None, e))
+    return outcomes
+
+
+def _as_problem(instance: Instance) -> Tuple[Instance, Optional[BaseException]]:
+    """(problem, None), or (instance, error) if no Problem can be built from it."""
+    if isinstance(instance, Problem):
+        return instance, None
+    try:
+        return Problem(*instance), None
+    except Exception as e:
+        return instance, e
+
+
+def solve_many(instances: Iterable[Instance],
+               algorithm: Callable[..., Result],
+               workers: Optional[int] = None,
+               chunksize: int = DEFAULT_CHUNKSIZE,
+               **solver_kwargs) -> Iterator[BatchOutcome]:
+    """
+    Solve every instance with `algorithm` and yield (problem, result, error)
+    tuples in input order.
+
+    Args:
+        instances: Problems or (M, C, capacity) tuples; consumed lazily.
+        algorithm: Solver function, e.g. `search.bfs.solve`.
+        workers: Number of worker processes (defaults to the CPU count);
+            0 or 1 solves in this process.
+        chunksize: Instances handed to a worker per task.
+        solver_kwargs: Extra arguments for the solver, e.g. heuristic="pdb".
+
+    At most two chunks per worker are in flight, so memory stays bounded
+    however long `instances` is. Exactly one of result and error is None in
+    every yielded tuple. Invalid instances, such as (-1, 3, 2), are yielded
+    as given with the error raised by `Problem` and never reach a worker.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    problems = map(_as_problem, instances)
+    workers = os.cpu_count() or 1 if workers is None else workers
+
+    if workers <= 1:
+        for problem, error in problems:
+            if error is None:
+                (result, error), = _run_chunk(algorithm, [problem.key], solver_kwargs)
+            else:
+                result = None
+            yield problem, result, error
+        return
+
+    chunks = iter(lambda: list(islice(problems, chunksize)), [])
+    in_flight: "deque[Tuple[List[Tuple[Instance, Optional[BaseException]]], Future]]" = deque()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        def submit_next() -> bool:
+            chunk = next(chunks, None)
+            if chunk is None:
+                return False
+            keys = [problem.key for problem, error in chunk if error is None]
+            in_flight.append((chunk, executor.submit(_run_chunk, algorithm, keys, solver_kwargs)))
+            return True
+
+        while len(in_flight) < 2 * workers and submit_next():
+            pass
+
+        try:
+            while in_flight:
+                chunk, future = in_flight.popleft()
+                outcomes = iter(future.result())
+                submit_next()
+                for problem, error in chunk:
+                    if error is None:
+                        yield (problem, *next(outcomes))
+                    else:
+                        yield problem, None, error
+        finally:
+            # Abandoned by the caller: drop queued chunks instead of solving them
+            for _, future in in_flight:
+                future.cancel()
@@ -0,0 +1,27 @@
+# core/paths.py
+"""
+Path reconstruction from tuple-keyed parent pointers, shared by the solvers
+that record a `came_from` dict. `core.packed.reconstruct_path` does the same
+for parent tables indexed by packed state.
+"""
+
+from typing import List, Mapping, Optional
+
+from core.river_crossing import State
+
+
+def reconstruct(came_from: Mapping[State, Optional[State]], goal: State) -> List[State]:
+    """
+    Follow parent pointers back from `goal` to the state whose parent is None.
+
+    Returns:
+        list: [initial_state, ..., goal]
+    """
+    path = [goal]
+    current = came_from[goal]
+    while current is not None:
+        path.append(current)
+        current = came_from[current]
+
+    path.reverse()
+    return path
@@ -0,0 +1,127 @@
+# core/pattern_db.py
+"""
+Exact pattern database: true distance-to-goal for every state of an instance.
+
+Because every trip can be reversed, a single BFS backward from the goal
+state over the transition index yields the optimal number of crossings from
+every state that can still reach the goal. Distances are stored in an
+array('i') indexed by packed state (-1 = goal unreachable) and can be
+saved to / loaded from a compact binary file:
+
+    header: b"RCPD", M, C, capacity   (little-endian uint32s)
+    body:   num_states little-endian int32 distances
+
+With the database as heuristic, A* and Greedy walk straight down an optimal
+path without expanding anything else.
+"""
+
+from array import array
+from collections import deque
+from functools import lru_cache
+import os
+import struct
+import sys
+from typing import Callable, Optional, TypeVar
+
+from core.river_crossing import Problem
+from core.index import get_index
+
+UNREACHABLE = -1
+
+MAGIC = b"RCPD"
+HEADER = struct.Struct("<4sIII")
+
+# Directory where databases are persisted and looked up (disabled if unset)
+PDB_DIR = os.environ.get("RIVER_CROSSING_PDB_DIR")
+
+T = TypeVar("T")
+
+
+def build_pattern_db(problem: Problem) -> array:
+    """Backward BFS from the goal; returns distances indexed by packed state."""
+    index = get_index(problem)
+    offsets, targets = index.offsets, index.targets
+
+    distances = array('i', [UNREACHABLE]) * problem.num_states
+    goal_idx = problem.encode(problem.goal_state)
+    if not problem.is_valid_state(problem.goal_state):
+        return distances
+
+    distances[goal_idx] = 0
+    queue = deque([goal_idx])
+
+    while queue:
+        current = queue.popleft()
+        next_distance = distances[current] + 1
+        for neighbor in targets[offsets[current]:offsets[current + 1]]:
+            if distances[neighbor] == UNREACHABLE:
+                distances[neighbor] = next_distance
+                queue.append(neighbor)
+
+    return distances
+
+
+def save_pattern_db(problem: Problem, distances: array, path: str) -> None:
+    """Write `distances` for `problem` to `path`."""
+    body = array('i', distances)
+    if sys.byteorder != "little":
+        body.byteswap()
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, *problem.key))
+        body.tofile(f)
+
+
+def load_pattern_db(problem: Problem, path: str) -> array:
+    """Read a database written by `save_pattern_db` and check it matches `problem`."""
+    with open(path, "rb") as f:
+        magic, M, C, capacity = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a pattern database file")
+        if (M, C, capacity) != problem.key:
+            raise ValueError(f"{path} was built for Problem{(M, C, capacity)}, not {problem!r}")
+
+        distances = array('i')
+        distances.fromfile(f, problem.num_states)
+
+    if sys.byteorder != "little":
+        distances.byteswap()
+    return distances
+
+
+def pattern_db_path(problem: Problem, directory: str) -> str:
+    M, C, capacity = problem.key
+    return os.path.join(directory, f"pdb_{M}_{C}_{capacity}.bin")
+
+
+def load_or_build(problem: Problem, directory: Optional[str],
+                  path_for: Callable[[Problem, str], str],
+                  build: Callable[[Problem], T],
+                  save: Callable[[T, str], None],
+                  load: Callable[[Problem, str], T]) -> T:
+    """
+    File cache for per-instance tables (this database, core.state_graph):
+    load the table from `directory` if it is there, otherwise build it,
+    save it and load it back, so callers always get what is on disk.
+    Without a directory the table is only built.
+    """
+    if directory is None:
+        return build(problem)
+
+    path = path_for(problem, directory)
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        save(build(problem), path)
+    return load(problem, path)
+
+
+@lru_cache(maxsize=8)
+def get_pattern_db(problem: Problem, directory: Optional[str] = PDB_DIR) -> array:
+    """
+    Return the pattern database for `problem`: loaded from `directory` if a
+    file exists there, otherwise built (and saved there first when a
+    directory is given). Results are cached in memory per instance.
+    """
+    return load_or_build(problem, directory, pattern_db_path, build_pattern_db,
+                         lambda distances, path: save_pattern_db(problem, distances, path),
+                         load_pattern_db)
@@ -1,26 +1,186 @@
 # core/river_crossing.py
 
+from functools import lru_cache
 from typing import Tuple, List
 
+State = Tuple[int, int, int]
+Move = Tuple[int, int]
+
+# ----------------------------
+# MOVE GENERATION
+# ----------------------------
+
+@lru_cache(maxsize=None)
+def generate_moves(boat_capacity: int) -> Tuple[Move, ...]:
+    """
+    Generate every (missionaries, cannibals) load the boat can carry.
+
+    A load must contain between 1 and `boat_capacity` people and must itself
+    be safe (missionaries in the boat are never outnumbered by cannibals).
+    Pure-missionary loads come first, then pure-cannibal loads, then mixed
+    loads, which reproduces the classic move order for a capacity of 2.
+    """
+    moves: List[Move] = []
+    moves.extend((m, 0) for m in range(1, boat_capacity + 1))
+    moves.extend((0, c) for c in range(1, boat_capacity + 1))
+    for m in range(1, boat_capacity + 1):
+        for c in range(1, min(m, boat_capacity - m) + 1):
+            moves.append((m, c))
+    return tuple(moves)
+
+# ----------------------------
+# PROBLEM INSTANCE
+# ----------------------------
+
+class Problem:
+    """
+    A parameterized Missionaries and Cannibals instance.
+
+    States are (M_left, C_left, Boat_position) tuples — 1 = left, 0 = right.
+    Everybody starts on the left bank with the boat and must reach the right bank.
+    """
+
+    def __init__(self, n_missionaries: int = 3, n_cannibals: int = 3, boat_capacity: int = 2):
+        if n_missionaries < 0 or n_cannibals < 0:
+            raise ValueError("Missionary and cannibal counts must be non-negative")
+        if boat_capacity < 1:
+            raise ValueError("Boat capacity must be at least 1")
+
+        self.n_missionaries = n_missionaries
+        self.n_cannibals = n_cannibals
+        self.boat_capacity = boat_capacity
+
+        self.initial_state: State = (n_missionaries, n_cannibals, 1)
+        self.goal_state: State = (0, 0, 0)
+        self.moves: Tuple[Move, ...] = generate_moves(boat_capacity)
+
+    @property
+    def key(self) -> Tuple[int, int, int]:
+        """(M, C, capacity) — identifies the instance for caching."""
+        return (self.n_missionaries, self.n_cannibals, self.boat_capacity)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Problem) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return f"Problem({self.n_missionaries}, {self.n_cannibals}, {self.boat_capacity})"
+
+    def is_valid_state(self, state: State) -> bool:
+        """
+        Check if a state is safe (no missionaries eaten) on both banks.
+        """
+        M_L, C_L, _ = state
+        M, C = self.n_missionaries, self.n_cannibals
+
+        if M_L < 0 or C_L < 0 or M_L > M or C_L > C:
+            return False
+
+        # Left bank
+        if M_L > 0 and C_L > M_L:
+            return False
+
+        # Right bank
+        M_R = M - M_L
+        C_R = C - C_L
+        if M_R > 0 and C_R > M_R:
+            return False
+
+        return True
+
+    def is_goal(self, state: State) -> bool:
+        return state == self.goal_state
+
+    def get_successors(self, state: State) -> List[State]:
+        """
+        Generate all valid successor states from the current state.
+        """
+        M_L, C_L, boat = state
+        successors = []
+
+        for m_move, c_move in self.moves:
+            if boat == 1:  # Boat on left → moving to right
+                new_state = (M_L - m_move, C_L - c_move, 0)
+            else:  # Boat on right → moving to left
+                new_state = (M_L + m_move, C_L + c_move, 1)
+
+            if self.is_valid_state(new_state):
+                successors.append(new_state)
+
+        return successors
+
+    # ----------------------------
+    # PACKED INTEGER ENCODING
+    # ----------------------------
+
+    @property
+    def num_states(self) -> int:
+        """Size of the packed index space (valid or not)."""
+        return (self.n_missionaries + 1) * (self.n_cannibals + 1) * 2
+
+    def encode(self, state: State) -> int:
+        """Pack (M_L, C_L, B) into idx = (M_L * (C + 1) + C_L) * 2 + B."""
+        M_L, C_L, boat = state
+        return (M_L * (self.n_cannibals + 1) + C_L) * 2 + boat
+
+    def decode(self, idx: int) -> State:
+        """Inverse of `encode`."""
+        rest, boat = divmod(idx, 2)
+        M_L, C_L = divmod(rest, self.n_cannibals + 1)
+        return (M_L, C_L, boat)
+
+    def get_successor_indices(self, idx: int) -> List[int]:
+        """
+        Same as `get_successors`, but on packed indices — no tuples are built.
+        """
+        M, C = self.n_missionaries, self.n_cannibals
+        stride = C + 1
+        rest, boat = divmod(idx, 2)
+        M_L, C_L = divmod(rest, stride)
+        sign = -1 if boat == 1 else 1
+        new_boat = 1 - boat
+        successors = []
+
+        for m_move, c_move in self.moves:
+            new_M_L = M_L + sign * m_move
+            new_C_L = C_L + sign * c_move
+            if new_M_L < 0 or new_C_L < 0 or new_M_L > M or new_C_L > C:
+                continue
+            if new_M_L > 0 and new_C_L > new_M_L:
+                continue
+            M_R = M - new_M_L
+            if M_R > 0 and C - new_C_L > M_R:
+                continue
+            successors.append((new_M_L * stride + new_C_L) * 2 + new_boat)
+
+        return successors
+
+    def heuristic(self, state: State) -> float:
+        """
+        Admissible heuristic: every crossing carries at most `boat_capacity`
+        people, so at least (M_L + C_L) / capacity crossings remain.
+        """
+        M_L, C_L, _ = state
+        return (M_L + C_L) / float(self.boat_capacity)
+
 # ----------------------------
 # GLOBAL CONSTANTS
 # ----------------------------
 
+# The classic instance: 3 missionaries, 3 cannibals, boat for 2
+DEFAULT_PROBLEM = Problem(3, 3, 2)
+
 # Initial and goal states
-INITIAL_STATE = (3, 3, 1)   # (M_left, C_left, Boat_position) — 1 = left, 0 = right
-GOAL_STATE = (0, 0, 0)
+INITIAL_STATE = DEFAULT_PROBLEM.initial_state   # (M_left, C_left, Boat_position) — 1 = left, 0 = right
+GOAL_STATE = DEFAULT_PROBLEM.goal_state
 
 # All possible moves (missionaries, cannibals) that the boat can carry
-MOVES = [
-    (1, 0),  # 1 missionary
-    (2, 0),  # 2 missionaries
-    (0, 1),  # 1 cannibal
-    (0, 2),  # 2 cannibals
-    (1, 1),  # 1 missionary + 1 cannibal
-]
+MOVES = list(DEFAULT_PROBLEM.moves)
 
-# Boat capacity (for future extensibility)
-BOAT_CAPACITY = 2
+# Boat capacity
+BOAT_CAPACITY = DEFAULT_PROBLEM.boat_capacity
 
 # ----------------------------
 # STATE VALIDITY CHECK
@@ -28,34 +188,19 @@ BOAT_CAPACITY = 2
 
 def is_valid_state(state: Tuple[int, int, int]) -> bool:
     """
-    Check if a state is safe (no missionaries eaten).
+    Check if a state of the classic instance is safe (no missionaries eaten).
     A state (M_L, C_L, B) is valid if:
       - On left bank: M_L == 0 or M_L >= C_L
       - On right bank: (3 - M_L) == 0 or (3 - M_L) >= (3 - C_L)
     """
-    M_L, C_L, _ = state
-
-    # Left bank check
-    if M_L < 0 or C_L < 0 or M_L > 3 or C_L > 3:
-        return False
-
-    if M_L > 0 and C_L > M_L:
-        return False
-
-    # Right bank
-    M_R = 3 - M_L
-    C_R = 3 - C_L
-    if M_R > 0 and C_R > M_R:
-        return False
-
-    return True
+    return DEFAULT_PROBLEM.is_valid_state(state)
 
 # ----------------------------
 # GOAL TEST
 # ----------------------------
 
 def is_goal(state: Tuple[int, int, int]) -> bool:
-    return state == GOAL_STATE
+    return DEFAULT_PROBLEM.is_goal(state)
 
 # ----------------------------
 # GENERATE SUCCESSOR STATES
@@ -65,25 +210,7 @@ def get_successors(state: Tuple[int, int, int]) -> List[Tuple[int, int, int]]:
     """
     Generate all valid successor states from the current state.
     """
-    M_L, C_L, boat = state
-    successors = []
-
-    for m_move, c_move in MOVES:
-        if boat == 1:  # Boat on left → moving to right
-            new_M_L = M_L - m_move
-            new_C_L = C_L - c_move
-            new_boat = 0
-        else:  # Boat on right → moving to left
-            new_M_L = M_L + m_move
-            new_C_L = C_L + c_move
-            new_boat = 1
-
-        new_state = (new_M_L, new_C_L, new_boat)
-
-        if is_valid_state(new_state):
-            successors.append(new_state)
-
-    return successors
+    return DEFAULT_PROBLEM.get_successors(state)
 
 # ----------------------------
 # HEURISTIC FUNCTION (for A* and Greedy)
@@ -92,10 +219,6 @@ def get_successors(state: Tuple[int, int, int]) -> List[Tuple[int, int, int]]:
 def heuristic(state: Tuple[int, int, int]) -> float:
     """
     Admissible heuristic: minimum number of one-way trips needed.
-    h(s) = ceil((M_L + C_L) / 2) — but float division is fine for comparison.
-    Using ceiling ensures admissibility, but for simplicity, we can use:
+    h(s) = (M_L + C_L) / 2 for the classic boat of capacity 2.
     """
-    M_L, C_L, _ = state
-    return (M_L + C_L) / 2.0  # Still admissible because real trips >= this value
-
-print(get_successors((1,1,0)))
+    return DEFAULT_PROBLEM.heuristic(state)
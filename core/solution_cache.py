@@ -0,0 +1,241 @@
+# core/solution_cache.py
+"""
+Caches of solver results.
+
+`SolutionCache` is a persistent on-disk cache (SQLite). `MemoryCache` is a
+bounded in-process LRU that can sit in front of it.
+
+Entries are keyed by (M, C, capacity, algorithm, heuristic) and hold the
+solution path together with the metrics of the run that produced it
+(nodes explored, time in ms). Every read refreshes an entry's LRU stamp, and
+once the table grows past `max_entries` the least recently used rows are
+evicted.
+
+The cache file defaults to ~/.cache/river_crossing/solutions.sqlite3 and can
+be moved with the RIVER_CROSSING_CACHE environment variable. If the file
+cannot be opened the cache prints a warning and turns into a pass-through.
+"""
+
+from collections import OrderedDict
+import json
+import os
+import sqlite3
+import time
+from typing import Callable, List, Optional, Tuple
+
+from core.river_crossing import DEFAULT_PROBLEM, Problem, State
+
+Result = Tuple[List[State], int, float]
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    "RIVER_CROSSING_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "river_crossing", "solutions.sqlite3"),
+)
+DEFAULT_MAX_ENTRIES = 10_000
+
+# Bump when solver output changes so stale results are dropped
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS solutions (
+    m INTEGER NOT NULL,
+    c INTEGER NOT NULL,
+    capacity INTEGER NOT NULL,
+    algorithm TEXT NOT NULL,
+    heuristic TEXT NOT NULL,
+    path TEXT NOT NULL,
+    nodes INTEGER NOT NULL,
+    time_ms REAL NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (m, c, capacity, algorithm, heuristic)
+);
+CREATE INDEX IF NOT EXISTS solutions_lru ON solutions (last_used);
+"""
+
+
+class SolutionCache:
+    """LRU-bounded SQLite store of (path, nodes_explored, time_ms) results."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+
+        try:
+            if path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._conn = sqlite3.connect(path)
+            self._init_schema()
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: solution cache disabled ({e})")
+            self._conn = None
+
+    def _init_schema(self) -> None:
+        # WAL without per-commit fsync keeps LRU-stamp updates on hits cheap;
+        # a crash can lose the latest stamps but never corrupts the file
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS solutions")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    @staticmethod
+    def _key(problem: Problem, algorithm: str, heuristic: Optional[str]) -> Tuple:
+        return (*problem.key, algorithm, heuristic or "")
+
+    def get(self, problem: Problem, algorithm: str, heuristic: Optional[str] = None) -> Optional[Result]:
+        """Cached result for the key, or None on a miss."""
+        if self._conn is None:
+            return None
+
+        key = self._key(problem, algorithm, heuristic)
+        row = self._conn.execute(
+            "SELECT path, nodes, time_ms FROM solutions "
+            "WHERE m = ? AND c = ? AND capacity = ? AND algorithm = ? AND heuristic = ?",
+            key,
+        ).fetchone()
+        if row is None:
+            return None
+
+        self._conn.execute(
+            "UPDATE solutions SET last_used = ? "
+            "WHERE m = ? AND c = ? AND capacity = ? AND algorithm = ? AND heuristic = ?",
+            (time.time_ns(), *key),
+        )
+        self._conn.commit()
+
+        path_json, nodes, time_ms = row
+        path = [tuple(state) for state in json.loads(path_json)]
+        return path, nodes, time_ms
+
+    def put(self, problem: Problem, algorithm: str, heuristic: Optional[str], result: Result) -> None:
+        """Store `result` and evict least recently used entries past the size cap."""
+        if self._conn is None:
+            return
+
+        path, nodes, time_ms = result
+        self._conn.execute(
+            "INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (*self._key(problem, algorithm, heuristic),
+             json.dumps(path, separators=(",", ":")), nodes, time_ms, time.time_ns()),
+        )
+        self._conn.execute(
+            "DELETE FROM solutions WHERE rowid IN ("
+            "SELECT rowid FROM solutions ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        self._conn.commit()
+
+    def solve(self, algorithm: str, solver: Callable[..., Result],
+              problem: Optional[Problem] = None, heuristic: Optional[str] = None) -> Result:
+        """
+        Return the cached result for `algorithm`, running `solver` (and
+        caching its result) on a miss. `heuristic` is passed to the solver
+        only when given.
+        """
+        problem = problem or DEFAULT_PROBLEM
+
+        cached = self.get(problem, algorithm, heuristic)
+        if cached is not None:
+            return cached
+
+        if heuristic is None:
+            result = solver(problem)
+        else:
+            result = solver(problem, heuristic=heuristic)
+        self.put(problem, algorithm, heuristic, result)
+        return result
+
+    def clear(self) -> None:
+        if self._conn is not None:
+            self._conn.execute("DELETE FROM solutions")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        if self._conn is None:
+            return 0
+        return self._conn.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class MemoryCache:
+    """
+    Bounded in-process LRU of solver results with hit/miss counters.
+
+    Misses are forwarded to `backing` (e.g. a SolutionCache) when given,
+    otherwise the solver is run directly.
+    """
+
+    def __init__(self, max_entries: int = 128, backing: Optional[SolutionCache] = None):
+        self.max_entries = max_entries
+        self.backing = backing
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, Result]" = OrderedDict()
+
+    def get(self, problem: Problem, algorithm: str, heuristic: Optional[str] = None) -> Optional[Result]:
+        """Same contract as `SolutionCache.get`; backing hits are kept in memory."""
+        key = (problem.key, algorithm, heuristic)
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        result = self.backing.get(problem, algorithm, heuristic) if self.backing is not None else None
+        if result is not None:
+            self._store(key, result)
+        return result
+
+    def put(self, problem: Problem, algorithm: str, heuristic: Optional[str], result: Result,
+            persist: bool = True) -> None:
+        """Store `result` here and, if `persist`, in the backing cache."""
+        if persist and self.backing is not None:
+            self.backing.put(problem, algorithm, heuristic, result)
+        self._store((problem.key, algorithm, heuristic), result)
+
+    def _store(self, key: Tuple, result: Result) -> None:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def solve(self, algorithm: str, solver: Callable[..., Result],
+              problem: Optional[Problem] = None, heuristic: Optional[str] = None) -> Result:
+        """Same contract as `SolutionCache.solve`."""
+        problem = problem or DEFAULT_PROBLEM
+        key = (problem.key, algorithm, heuristic)
+
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        if self.backing is not None:
+            result = self.backing.solve(algorithm, solver, problem, heuristic)
+        elif heuristic is None:
+            result = solver(problem)
+        else:
+            result = solver(problem, heuristic=heuristic)
+
+        self._store(key, result)
+        return result
+
+    def invalidate(self, problem: Optional[Problem] = None) -> None:
+        """Drop every entry for `problem`, or everything when no problem is given."""
+        if problem is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == problem.key]:
+            del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
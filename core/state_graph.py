@@ -0,0 +1,247 @@
+# core/state_graph.py
+"""
+Complete reachable state graph of an instance, explored once and exported.
+
+`explore` runs one BFS sweep from the initial state over the transition
+index and materializes everything later analysis needs into compact int32
+arrays, with reachable states numbered 0..n-1 in packed-index order:
+
+  - states:         packed index of each reachable state (sorted, so a
+                    state's number is found by binary search)
+  - offsets/targets CSR transition edges between state numbers, in
+                    move-table order
+  - start_distance: BFS depth from the initial state
+  - goal_distance:  optimal number of crossings left (-1 = goal unreachable)
+  - dead_ends:      numbers of the states that cannot reach the goal
+
+Because every trip can be reversed, the reachable graph is one connected
+component: either every state reaches the goal or none does (the instance
+is unsolvable). Goal distances are read from the instance's pattern
+database (core.pattern_db), so the two never disagree.
+
+The graph is saved as a binary file laid out for memory mapping:
+
+    header: b"RCSG", M, C, capacity, states, edges, dead ends
+            (little-endian uint32s)
+    body:   states, offsets, targets, start_distance, goal_distance and
+            dead_ends as consecutive little-endian int32 arrays
+
+`load_state_graph` maps the file and exposes the sections as zero-copy
+views, so opening even a multi-million-state graph is instant and queries
+only touch the pages they read.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import deque
+from functools import lru_cache
+import mmap
+import os
+import struct
+import sys
+from typing import List, Optional, Sequence
+
+from core.river_crossing import Problem, State
+from core.index import get_index
+from core.pattern_db import UNREACHABLE, get_pattern_db, load_or_build
+
+MAGIC = b"RCSG"
+HEADER = struct.Struct("<4sIIIIII")
+ITEM_SIZE = 4
+
+# Directory where graphs are persisted and looked up (disabled if unset)
+GRAPH_DIR = os.environ.get("RIVER_CROSSING_GRAPH_DIR")
+
+
+class StateGraph:
+    """Reachable states, edges and distances of one instance."""
+
+    def __init__(self, problem: Problem, states: Sequence[int], offsets: Sequence[int],
+                 targets: Sequence[int], start_distance: Sequence[int],
+                 goal_distance: Sequence[int], dead_ends: Sequence[int]):
+        self.problem = problem
+        self.states = states
+        self.offsets = offsets
+        self.targets = targets
+        self.start_distance = start_distance
+        self.goal_distance = goal_distance
+        self.dead_ends = dead_ends
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def __contains__(self, state: State) -> bool:
+        return self.number(state) is not None
+
+    def __repr__(self) -> str:
+        return f"StateGraph({self.problem!r}, states={len(self)}, edges={self.num_edges})"
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    @property
+    def solvable(self) -> bool:
+        return len(self.states) > 0 and not self.dead_ends
+
+    def number(self, state: State) -> Optional[int]:
+        """The state's number in this graph, or None if it is not reachable."""
+        if not self.problem.is_valid_state(state):
+            return None
+        idx = self.problem.encode(state)
+        i = bisect_left(self.states, idx)
+        if i < len(self.states) and self.states[i] == idx:
+            return i
+        return None
+
+    def state(self, number: int) -> State:
+        return self.problem.decode(self.states[number])
+
+    def successors(self, state: State) -> List[State]:
+        """Successors of a reachable state (empty for unreachable states)."""
+        i = self.number(state)
+        if i is None:
+            return []
+        return [self.state(j) for j in self.targets[self.offsets[i]:self.offsets[i + 1]]]
+
+    def distance_to_goal(self, state: State) -> Optional[int]:
+        """Optimal crossings from `state` to the goal, or None if it cannot get there."""
+        i = self.number(state)
+        if i is None or self.goal_distance[i] == UNREACHABLE:
+            return None
+        return self.goal_distance[i]
+
+    def distance_from_start(self, state: State) -> Optional[int]:
+        """Fewest crossings from the initial state, or None if unreachable."""
+        i = self.number(state)
+        return None if i is None else self.start_distance[i]
+
+    def dead_end_states(self) -> List[State]:
+        return [self.state(i) for i in self.dead_ends]
+
+    def shortest_path(self, state: Optional[State] = None) -> List[State]:
+        """
+        An optimal path from `state` (default: the initial state) to the
+        goal, read off the goal distances without any search; [] if none.
+        """
+        i = self.number(self.problem.initial_state if state is None else state)
+        if i is None or self.goal_distance[i] == UNREACHABLE:
+            return []
+
+        offsets, targets, goal_distance = self.offsets, self.targets, self.goal_distance
+        path = [i]
+        while goal_distance[i] > 0:
+            # First successor (in move-table order) one step closer
+            closer = goal_distance[i] - 1
+            i = next(j for j in targets[offsets[i]:offsets[i + 1]] if goal_distance[j] == closer)
+            path.append(i)
+        return [self.state(j) for j in path]
+
+
+def explore(problem: Problem) -> StateGraph:
+    """One BFS sweep from the initial state; returns the full reachable graph."""
+    index = get_index(problem)
+    global_offsets, global_targets = index.offsets, index.targets
+
+    start = problem.initial_state
+    if not problem.is_valid_state(start):
+        empty = array('i')
+        return StateGraph(problem, empty, array('i', [0]), empty, empty, empty, empty)
+
+    # Packed index -> BFS depth over the whole state space (-1 = not seen)
+    depth = array('i', [UNREACHABLE]) * problem.num_states
+    start_idx = problem.encode(start)
+    depth[start_idx] = 0
+    reached = [start_idx]
+    queue = deque(reached)
+
+    while queue:
+        current = queue.popleft()
+        next_depth = depth[current] + 1
+        for neighbor in global_targets[global_offsets[current]:global_offsets[current + 1]]:
+            if depth[neighbor] == UNREACHABLE:
+                depth[neighbor] = next_depth
+                reached.append(neighbor)
+                queue.append(neighbor)
+
+    # Renumber reachable states in packed-index order and relabel the edges
+    reached.sort()
+    states = array('i', reached)
+    number = array('i', [UNREACHABLE]) * problem.num_states
+    for i, idx in enumerate(reached):
+        number[idx] = i
+    offsets = array('i', [0])
+    packed_targets = array('i')
+    for idx in reached:
+        packed_targets.extend(global_targets[global_offsets[idx]:global_offsets[idx + 1]])
+        offsets.append(len(packed_targets))
+    targets = array('i', map(number.__getitem__, packed_targets))
+    start_distance = array('i', map(depth.__getitem__, reached))
+
+    goal_distance = array('i', map(get_pattern_db(problem).__getitem__, reached))
+    dead_ends = array('i', (i for i, d in enumerate(goal_distance) if d == UNREACHABLE))
+    return StateGraph(problem, states, offsets, targets, start_distance, goal_distance, dead_ends)
+
+
+def _sections(graph: StateGraph) -> List[Sequence[int]]:
+    return [graph.states, graph.offsets, graph.targets,
+            graph.start_distance, graph.goal_distance, graph.dead_ends]
+
+
+def save_state_graph(graph: StateGraph, path: str) -> None:
+    """Write `graph` to `path` in the memory-mappable layout described above."""
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, *graph.problem.key, len(graph), graph.num_edges, len(graph.dead_ends)))
+        for section in _sections(graph):
+            body = array('i', section)
+            if sys.byteorder != "little":
+                body.byteswap()
+            body.tofile(f)
+
+
+def load_state_graph(problem: Problem, path: str) -> StateGraph:
+    """
+    Map a graph written by `save_state_graph` and check it matches `problem`.
+    The sections are read-only views into the mapping.
+    """
+    with open(path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, M, C, capacity, num_states, num_edges, num_dead = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a state graph file")
+    if (M, C, capacity) != problem.key:
+        raise ValueError(f"{path} was built for Problem{(M, C, capacity)}, not {problem!r}")
+
+    lengths = (num_states, num_states + 1, num_edges, num_states, num_states, num_dead)
+    if len(data) != HEADER.size + ITEM_SIZE * sum(lengths):
+        raise ValueError(f"{path} is truncated or corrupt")
+
+    view = memoryview(data)
+    sections = []
+    start = HEADER.size
+    for length in lengths:
+        end = start + ITEM_SIZE * length
+        section = view[start:end].cast('i')
+        if sys.byteorder != "little":
+            section = array('i', section)
+            section.byteswap()
+        sections.append(section)
+        start = end
+
+    return StateGraph(problem, *sections)
+
+
+def state_graph_path(problem: Problem, directory: str) -> str:
+    M, C, capacity = problem.key
+    return os.path.join(directory, f"graph_{M}_{C}_{capacity}.bin")
+
+
+@lru_cache(maxsize=8)
+def get_state_graph(problem: Problem, directory: Optional[str] = GRAPH_DIR) -> StateGraph:
+    """
+    Return the state graph of `problem`: mapped from `directory`, where it
+    is saved first if missing, or just explored when no directory is given.
+    Results are cached in memory per instance.
+    """
+    return load_or_build(problem, directory, state_graph_path, explore, save_state_graph, load_state_graph)
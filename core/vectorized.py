@@ -0,0 +1,75 @@
+# core/vectorized.py
+"""
+Vectorized (NumPy) successor generation for whole frontier batches.
+
+Instead of expanding one state at a time, a frontier of shape (n, 3) is
+broadcast against the (K, 2) move matrix, giving an (n, K) grid of candidate
+states. The `is_valid_state` rules are then applied as boolean masks.
+
+NumPy is an optional dependency: import this module only when it is needed.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from core.river_crossing import Problem
+
+
+def move_matrix(problem: Problem) -> np.ndarray:
+    """The problem's move table as a (K, 2) int array."""
+    return np.array(problem.moves, dtype=np.int64).reshape(-1, 2)
+
+
+def encode_states(problem: Problem, states: np.ndarray) -> np.ndarray:
+    """Vectorized `Problem.encode` for an (n, 3) state array."""
+    return (states[:, 0] * (problem.n_cannibals + 1) + states[:, 1]) * 2 + states[:, 2]
+
+
+def decode_states(problem: Problem, indices: np.ndarray) -> np.ndarray:
+    """Vectorized `Problem.decode`; returns an (n, 3) state array."""
+    rest, boat = np.divmod(indices, 2)
+    M_L, C_L = np.divmod(rest, problem.n_cannibals + 1)
+    return np.stack([M_L, C_L, boat], axis=1)
+
+
+def expand_frontier(problem: Problem, states: np.ndarray,
+                    moves: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate the valid successors of every state in a frontier batch.
+
+    Args:
+        problem: Problem instance the states belong to
+        states: (n, 3) int array of (M_L, C_L, B) rows
+        moves: optional precomputed `move_matrix(problem)`
+
+    Returns:
+        tuple: (successors, sources)
+            - successors: (k, 3) int array of valid successor states, ordered
+              by source row and then by move-table order (same order as
+              calling `get_successors` on each row in turn)
+            - sources: (k,) row index into `states` each successor came from
+    """
+    if moves is None:
+        moves = move_matrix(problem)
+    M, C = problem.n_missionaries, problem.n_cannibals
+
+    boat = states[:, 2:3]
+    # Boat on left (1) → people leave the left bank; on right (0) → they return
+    sign = np.where(boat == 1, -1, 1)
+
+    new_M_L = states[:, 0:1] + sign * moves[:, 0]
+    new_C_L = states[:, 1:2] + sign * moves[:, 1]
+    new_boat = np.broadcast_to(1 - boat, new_M_L.shape)
+
+    M_R = M - new_M_L
+    C_R = C - new_C_L
+    valid = (
+        (new_M_L >= 0) & (new_C_L >= 0) & (new_M_L <= M) & (new_C_L <= C)
+        & ((new_M_L == 0) | (new_C_L <= new_M_L))   # left bank
+        & ((M_R == 0) | (C_R <= M_R))                # right bank
+    )
+
+    sources, _ = np.nonzero(valid)
+    successors = np.stack([new_M_L[valid], new_C_L[valid], new_boat[valid]], axis=1)
+    return successors, sources
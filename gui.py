@@ -1,51 +1,139 @@
+import argparse
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, simpledialog
 import os
-import pygame
-from tkinter import messagebox
 import time
-import math
-from typing import List, Tuple
-
-# Import solvers
-from search.bfs import solve as bfs_solve
-from search.dfs import solve as dfs_solve
-from search.astar import solve as astar_solve
-from search.greedy import solve as greedy_solve
-from search.csp import solve as csp_solve
-
-from core.river_crossing import GOAL_STATE, INITIAL_STATE
-
-# Colors
-COLOR_SKY = "#87CEEB"
-COLOR_RIVER = "#4682B4"
-COLOR_LAND = "#228B22"
-COLOR_BOAT = "#8B4513"
-COLOR_MISSIONARY = "#FFD700"  # Gold
-COLOR_CANNIBAL = "#FF4500"    # OrangeRed
-COLOR_TEXT = "#FFFFFF"
-
-class RiverCrossingApp:
+import queue
+import threading
+from concurrent.futures import TimeoutError
+
+# Solvers are imported on first use
+from search.registry import get_search_iter, parse_size, solvers
+
+from core.river_crossing import DEFAULT_PROBLEM
+from core.parallel import solve_parallel
+from core.solution_cache import MemoryCache, SolutionCache
+from scene import SceneRenderer, STEP_SEC
+
+# Seconds each solver may run in "Compare All Algorithms"
+SOLVER_TIMEOUT = 60.0
+
+# How often the Tk loop checks on a background solve
+POLL_MS = 50
+
+# How long closing the window waits for a cancelled solve to wind down
+EXIT_JOIN_SEC = 1.0
+
+# Target frame interval; slow frames are dropped rather than queued
+FRAME_MS = 20
+
+PLAYBACK_SPEEDS = (0.25, 0.5, 1, 2, 4, 8, 16, 32, 64)
+# Long solutions start fast enough to play in about this long
+MAX_DEFAULT_PLAYBACK_SEC = 60.0
+
+
+class SearchJob:
+    """
+    Runs one `search_iter` generator on a daemon thread. The Tk loop polls
+    `progress` and `done`; `cancel` stops the search after its current
+    expansion.
+    """
+
+    def __init__(self, search_iter, problem):
+        self.progress = 0
+        self.result = None
+        self.error = None
+        self.done = False
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(search_iter, problem), daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+    def _run(self, search_iter, problem):
+        start_time = time.perf_counter()
+        events = search_iter(problem)
+        try:
+            while True:
+                try:
+                    next(events)
+                except StopIteration as stop:
+                    path = stop.value or []
+                    break
+                self.progress += 1
+                if self._cancel.is_set():
+                    events.close()
+                    return
+            self.result = (path, self.progress, (time.perf_counter() - start_time) * 1000)
+        except Exception as e:
+            self.error = e
+        finally:
+            self.done = True
+
+
+class ComparisonJob:
+    """
+    Drives `solve_parallel` on a daemon thread and hands each
+    (name, result, error) outcome to the Tk loop through `outcomes`.
+    """
+
+    def __init__(self, solvers, problem, timeout):
+        self.outcomes = queue.Queue()
+        self.done = False
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(solvers, problem, timeout), daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+    def _run(self, solvers, problem, timeout):
+        try:
+            for outcome in solve_parallel(solvers, problem, timeout=timeout, cancel=self._cancel):
+                self.outcomes.put(outcome)
+        finally:
+            self.done = True
+
+class RiverCrossingApp(SceneRenderer):
     def __init__(self, root):
         self.root = root
         self.root.title("River Crossing Problem Solver")
         self.root.geometry("800x600")
         self.root.resizable(False, False)
+        self.root.protocol("WM_DELETE_WINDOW", self.exit_app)
 
         self.canvas = tk.Canvas(root, width=800, height=600, highlightthickness=0)
         self.canvas.pack(fill="both", expand=True)
 
-        self.solvers = {
-            "BFS": bfs_solve,
-            "DFS": dfs_solve,
-            "A*": astar_solve,
-            "Greedy": greedy_solve,
-            "CSP": csp_solve
-        }
+        self.solvers = solvers()
 
-        self.current_state = INITIAL_STATE
-        self.animation_speed = 0.02  # seconds per frame
+        self.problem = DEFAULT_PROBLEM
+        self.solution_cache = SolutionCache()
+        # Per-session results, backed by the on-disk cache
+        self.result_cache = MemoryCache(backing=self.solution_cache)
+        self.current_state = self.problem.initial_state
         self.is_animating = False
+
+        # Background solve in progress (SearchJob / ComparisonJob), if any
+        self.job = None
+
+        # Retained animation scene: sprite tag -> current (x, y)
+        self.sprite_positions = {}
+        self.move_text_id = None
+
+        # Animation timeline, advanced by perf_counter deltas
+        self.anim_path = []
+        self.anim_time = 0.0
+        self.anim_last_tick = 0.0
+        self.playback_speed = 1
+        self.playback_label_id = None
         
         # Metrics
         self.metrics = None
@@ -57,30 +145,58 @@ class RiverCrossingApp:
         self.control_ids = []
 
 
-        # Audio System
-        self.init_audio()
+        # Audio System: started once the window is up, so loading pygame
+        # does not hold back the first paint
+        self.mixer = None
+        self.root.after_idle(self.init_audio)
 
         # Volume Control Slider (Persistent)
         self.create_volume_slider()
 
         self.show_start_menu()
 
+    def set_problem(self, problem):
+        """Switch to another problem instance; cached results of the old one are dropped."""
+        if problem != self.problem:
+            self.result_cache.invalidate(self.problem)
+        self.problem = problem
+        self.current_state = problem.initial_state
+
+    def ask_problem(self):
+        M, C, capacity = self.problem.key
+        text = simpledialog.askstring("Problem instance", "Missionaries, cannibals, boat capacity:",
+                                      initialvalue=f"{M},{C},{capacity}", parent=self.root)
+        if text is None:
+            return
+        try:
+            problem = parse_size(text)
+        except (argparse.ArgumentTypeError, ValueError) as e:
+            messagebox.showerror("Invalid instance", str(e))
+            return
+        self.set_problem(problem)
+        self.show_start_menu()
+
     def show_start_menu(self):
         self.canvas.delete("all")
         self.draw_background()
         
+        # Instance picker
+        M, C, capacity = self.problem.key
+        self.create_button(400, 70, f"Instance: {M}, {C}, boat {capacity}", self.ask_problem, bg_color="#4B3621")
+
         # Title
         self.canvas.create_text(400, 150, text="River Crossing Problem", font=("Helvetica", 36, "bold"), fill="white", tags="menu")
         self.canvas.create_text(400, 200, text="Choose an Algorithm to Solve", font=("Helvetica", 18), fill="white", tags="menu")
 
         # Buttons
-        y_start = 250
+        y_start = 240
+        spacing = 50
         for i, (name, solver) in enumerate(self.solvers.items()):
-            btn_y = y_start + i * 60
+            btn_y = y_start + i * spacing
             self.create_button(400, btn_y, name, lambda s=name: self.run_simulation(s))
             
         # Run All Algorithms Button
-        self.create_button(400, y_start + 5 * 60, "Compare All Algorithms", self.run_all_algorithms, bg_color="#2F4F4F")
+        self.create_button(400, y_start + len(self.solvers) * spacing, "Compare All Algorithms", self.run_all_algorithms, bg_color="#2F4F4F")
 
     def create_button(self, x, y, text, command, bg_color="#333"):
         # Simple custom button on canvas
@@ -100,51 +216,63 @@ class RiverCrossingApp:
         self.canvas.tag_bind(btn_id, "<Enter>", lambda e: self.canvas.itemconfig(btn_id, fill="#555"))
         self.canvas.tag_bind(btn_id, "<Leave>", lambda e: self.canvas.itemconfig(btn_id, fill=bg_color))
 
-    def draw_background(self):
-        # Sky
-        self.canvas.create_rectangle(0, 0, 800, 300, fill=COLOR_SKY, outline="")
-        # River
-        self.canvas.create_rectangle(0, 300, 800, 600, fill=COLOR_RIVER, outline="")
-        # Left Bank
-        self.canvas.create_rectangle(0, 300, 250, 600, fill=COLOR_LAND, outline="")
-        # Right Bank
-        self.canvas.create_rectangle(550, 300, 800, 600, fill=COLOR_LAND, outline="")
-        
-        # Sun
-        self.canvas.create_oval(650, 50, 750, 150, fill="#FFD700", outline="#FFA500", width=2)
-        
-        # Clouds
-        self.draw_cloud(100, 80)
-        self.draw_cloud(250, 50)
-        self.draw_cloud(450, 90)
-        self.draw_cloud(50, 150)
-
-    def draw_cloud(self, x, y):
-        # Draw a fluffy cloud using overlapping ovals
-        self.canvas.create_oval(x, y, x+40, y+30, fill="white", outline="", tags="background")
-        self.canvas.create_oval(x+20, y-10, x+60, y+30, fill="white", outline="", tags="background")
-        self.canvas.create_oval(x+40, y, x+80, y+30, fill="white", outline="", tags="background")
-
     def run_all_algorithms(self):
         self.canvas.delete("all")
         self.draw_background()
         
         # Loading
         self.canvas.create_text(400, 300, text="Running all algorithms...", font=("Helvetica", 24), fill="white", tags="loading")
-        self.root.update()
-        
-        results = []
-        for name, solver in self.solvers.items():
-            try:
-                path, nodes, time_taken = solver()
-                # path length = moves = len(path) - 1 if path else "N/A"
-                pl = len(path) - 1 if path else "Fail"
-                results.append((name, pl, nodes, time_taken * 1000))
-            except Exception as e:
-                results.append((name, "Error", 0, 0.0))
-        
-        self.canvas.delete("loading")
-        self.show_comparison_view(results)
+        self.canvas.create_text(400, 340, text="", font=("Helvetica", 14), fill="white", tags="loading_progress")
+        self.create_button(400, 420, "Cancel", self.cancel_job, bg_color="#8B0000")
+
+        # Cached results are shown as is; the rest run in parallel worker
+        # processes driven from a background thread, so the window stays live
+        rows = {}
+        for name in self.solvers:
+            cached = self.result_cache.get(self.problem, name)
+            if cached is not None:
+                rows[name] = self.comparison_row(name, cached, None)
+
+        pending = {name: solver for name, solver in self.solvers.items() if name not in rows}
+        self.job = ComparisonJob(pending, self.problem, SOLVER_TIMEOUT) if pending else None
+        self.poll_comparison(self.job, rows, time.perf_counter())
+
+    def poll_comparison(self, job, rows, started):
+        if job is not self.job:
+            return  # Cancelled
+
+        if job is not None:
+            while True:
+                try:
+                    name, result, error = job.outcomes.get_nowait()
+                except queue.Empty:
+                    break
+                if result is not None:
+                    self.result_cache.put(self.problem, name, None, result)
+                rows[name] = self.comparison_row(name, result, error)
+
+            if not job.done or not job.outcomes.empty():
+                self.canvas.itemconfig("loading_progress", text=f"{len(rows)}/{len(self.solvers)} finished "
+                                                                f"({time.perf_counter() - started:.1f} s)")
+                self.root.after(POLL_MS, lambda: self.poll_comparison(job, rows, started))
+                return
+
+        self.job = None
+        self.show_comparison_view([rows[name] for name in self.solvers])
+
+    def comparison_row(self, name, result, error):
+        if error is not None:
+            return (name, "Timeout" if isinstance(error, TimeoutError) else "Error", 0, 0.0)
+        path, nodes, time_taken = result
+        # path length = moves = len(path) - 1 if path else "N/A"
+        pl = len(path) - 1 if path else "Fail"
+        return (name, pl, nodes, time_taken)
+
+    def cancel_job(self):
+        if self.job is not None:
+            self.job.cancel()
+            self.job = None
+        self.show_start_menu()
 
     def show_comparison_view(self, results):
         self.canvas.delete("all")
@@ -186,20 +314,47 @@ class RiverCrossingApp:
         self.canvas.delete("menu")
         self.canvas.delete("menu_btn")
         
+        cached = self.result_cache.get(self.problem, algo_name)
+        if cached is not None:
+            self.show_solution(algo_name, cached)
+            return
+
         # Show loading or preparing info
         self.canvas.create_text(400, 300, text=f"Solving with {algo_name}...", font=("Helvetica", 24), fill="white", tags="loading")
-        self.root.update()
+        self.canvas.create_text(400, 340, text="", font=("Helvetica", 14), fill="white", tags="loading_progress")
+        self.create_button(400, 420, "Cancel", self.cancel_job, bg_color="#8B0000")
 
-        solver_func = self.solvers[algo_name]
-        try:
-            path, nodes, time_taken = solver_func()
-        except Exception as e:
-            messagebox.showerror("Error", f"Algorithm failed: {e}")
-            self.show_start_menu()
+        # Solve on a background thread so the window stays responsive
+        self.job = SearchJob(get_search_iter(algo_name), self.problem)
+        self.poll_simulation(algo_name, self.job)
+
+    def poll_simulation(self, algo_name, job):
+        if job is not self.job:
+            return  # Cancelled
+
+        if not job.done:
+            self.canvas.itemconfig("loading_progress", text=f"{job.progress:,} states expanded")
+            self.root.after(POLL_MS, lambda: self.poll_simulation(algo_name, job))
             return
 
+        self.job = None
         self.canvas.delete("loading")
-        
+        self.canvas.delete("loading_progress")
+        self.canvas.delete("menu_btn")
+
+        if job.error is not None:
+            messagebox.showerror("Error", f"Algorithm failed: {job.error}")
+            self.show_start_menu()
+            return
+
+        # Timed on a thread sharing the GIL with Tk, so the time is not what
+        # solve() would report: keep it for this session only
+        self.result_cache.put(self.problem, algo_name, None, job.result, persist=False)
+        self.show_solution(algo_name, job.result)
+
+    def show_solution(self, algo_name, result):
+        path, nodes, time_taken = result
+
         if not path:
             messagebox.showinfo("Result", "No solution found.")
             self.show_start_menu()
@@ -212,7 +367,7 @@ class RiverCrossingApp:
             "Algo": algo_name,
             "Path Length": len(path) - 1,
             "Nodes Explored": nodes,
-            "Time": f"{time_taken * 1000:.2f} ms"
+            "Time": f"{time_taken:.2f} ms"
         }
         
         self.create_metrics_button()
@@ -237,10 +392,17 @@ class RiverCrossingApp:
         # Bottom area controls
         y_pos = 570
         
+        # Playback speed
+        self.create_mini_button(150, y_pos, "Slower", lambda: self.change_speed(-1))
+        self.create_mini_button(250, y_pos, "Faster", lambda: self.change_speed(1))
         # Pause/Resume
         self.create_mini_button(350, y_pos, "Pause/Resume", self.toggle_pause)
         # End Game (Formerly Reset) -> Goes to Menu
         self.create_mini_button(450, y_pos, "End Game", self.reset_simulation, color="#8B0000")
+        # Seek
+        self.create_mini_button(550, y_pos, "Jump to...", self.ask_jump_to_step)
+
+        self.playback_label_id = self.canvas.create_text(680, y_pos, text="", fill="white", font=("Arial", 10, "bold"), tags="controls")
 
     def create_mini_button(self, x, y, text, command, color="#444"):
         w, h = 90, 30
@@ -261,7 +423,7 @@ class RiverCrossingApp:
             self.canvas.delete("ui")
             self.canvas.delete("controls")
             self.canvas.delete("metrics_overlay")
-            self.canvas.delete("entity")
+            self.clear_scene()
             self.canvas.delete("overlay")
             self.run_simulation(self.current_algo_name)
 
@@ -273,19 +435,31 @@ class RiverCrossingApp:
         self.show_start_menu()
 
     def exit_app(self):
-        pygame.mixer.quit()
+        if self.job is not None:
+            # Stops a comparison's worker processes too, so exit does not
+            # wait for them to reach SOLVER_TIMEOUT
+            self.job.cancel()
+            self.job.join(EXIT_JOIN_SEC)
+        self.solution_cache.close()
+        if self.mixer is not None:
+            self.mixer.quit()
         self.root.destroy()
     
     def init_audio(self):
+        # pygame is only needed for the background music: import it here so
+        # a missing or slow-loading pygame never delays (or breaks) the GUI
+        sound_path = os.path.join("sound", "test.mpeg")
+        if not os.path.exists(sound_path):
+            print(f"Warning: Sound file not found at {sound_path}")
+            return
         try:
-            pygame.mixer.init()
-            sound_path = os.path.join("sound", "test.mpeg")
-            if os.path.exists(sound_path):
-                pygame.mixer.music.load(sound_path)
-                pygame.mixer.music.play(-1)  # Loop indefinitely
-                pygame.mixer.music.set_volume(0.5)
-            else:
-                print(f"Warning: Sound file not found at {sound_path}")
+            from pygame import mixer
+
+            mixer.init()
+            mixer.music.load(sound_path)
+            mixer.music.play(-1)  # Loop indefinitely
+            mixer.music.set_volume(0.5)
+            self.mixer = mixer
         except Exception as e:
             print(f"Audio init error: {e}")
 
@@ -320,7 +494,8 @@ class RiverCrossingApp:
         try:
             # Convert 0-100 to 0.0-1.0
             volume = float(val) / 100.0
-            pygame.mixer.music.set_volume(volume)
+            if self.mixer is not None:
+                self.mixer.music.set_volume(volume)
         except Exception:
             pass
 
@@ -340,372 +515,91 @@ class RiverCrossingApp:
             
         # Draw semi-transparent box
         x1, y1 = 10, 60
-        x2, y2 = 250, 180
+        x2, y2 = 300, 200
         
         # Canvas doesn't support alpha directly for shapes easily without images or extra windows.
         # We'll simulate it with stipple or just solid color.
         self.canvas.create_rectangle(x1, y1, x2, y2, fill="#222", outline="white", width=2, tags="metrics_overlay")
         
+        # Session cache counters are read live, not frozen at solve time
+        lines = dict(self.metrics)
+        lines["Cache"] = f"{self.result_cache.hits} hits / {self.result_cache.misses} misses"
+
         y_text = y1 + 20
-        for key, value in self.metrics.items():
+        for key, value in lines.items():
             text = f"{key}: {value}"
             self.canvas.create_text(x1 + 10, y_text, text=text, anchor="w", fill="white", font=("Courier", 12), tags="metrics_overlay")
             y_text += 25
 
 
-    def draw_entities(self, state):
-        # Static draw for start/end
-        # Use draw_scene_phase with empty movers to just draw the state static
-        # boat_pos 1=Left, 0=Right.
-        direction = "LtoR" if state[2] == 1 else "RtoL"
-        self.draw_scene_phase("cross", state, [], direction, 0.0)
-
-    def draw_character(self, x, y, char_type, color):
-        if char_type == "M":
-            self.draw_missionary(x, y)
-        else:
-            self.draw_cannibal(x, y)
-
-    def draw_missionary(self, x, y):
-        # Draw Missionary (Robe style)
-        # Head
-        self.canvas.create_oval(x-8, y-35, x+8, y-19, fill="#FFCCAA", outline="black", tags="entity") # Skin head
-        
-        # Body (Robe)
-        # Triangle/Trapezoid shape
-        points = [x, y-20, x-12, y+10, x+12, y+10]
-        self.canvas.create_polygon(points, fill=COLOR_MISSIONARY, outline="black", tags="entity")
-        
-        # Cross on chest
-        self.canvas.create_line(x, y-15, x, y, fill="black", width=1, tags="entity")
-        self.canvas.create_line(x-5, y-10, x+5, y-10, fill="black", width=1, tags="entity")
-
-    def draw_cannibal(self, x, y):
-        # Draw Cannibal (Tribal style)
-        # Head
-        self.canvas.create_oval(x-8, y-35, x+8, y-19, fill="#D2691E", outline="black", tags="entity") # Darker skin head
-        
-        # Body (Torso)
-        self.canvas.create_oval(x-10, y-20, x+10, y+5, fill="#8B4513", outline="black", tags="entity") # Body
-        
-        # Skirt/Loincloth
-        skirt_points = [x-10, y, x+10, y, x+8, y+10, x-8, y+10]
-        self.canvas.create_polygon(skirt_points, fill=COLOR_CANNIBAL, outline="black", tags="entity")
-        
-        # Spear (held in hand)
-        self.canvas.create_line(x+10, y+10, x+15, y-25, fill="brown", width=2, tags="entity") # Shaft
-        self.canvas.create_polygon(x+14, y-25, x+16, y-25, x+15, y-30, fill="silver", outline="black", tags="entity") # Tip
-
-
     def animate_solution(self, path):
+        self.clear_scene()
         self.is_animating = True
-        self.animate_sequence(path, 0)
-        
-    def animate_sequence(self, path, index):
+        self.anim_path = path
+        self.anim_time = 0.0
+
+        # Long solutions start at the slowest speed that fits the time budget
+        playback_sec = (len(path) - 1) * STEP_SEC
+        self.playback_speed = next((speed for speed in PLAYBACK_SPEEDS
+                                    if speed >= 1 and playback_sec / speed <= MAX_DEFAULT_PLAYBACK_SEC),
+                                   PLAYBACK_SPEEDS[-1])
+
+        self.anim_last_tick = time.perf_counter()
+        self.animation_tick()
+
+    def animation_tick(self):
+        """
+        Draw the frame for the current playback time and schedule the next
+        tick. Time advances by real elapsed time x speed, so frames that
+        take too long are skipped instead of slowing playback down.
+        """
         if not self.is_animating:
             return
 
-        if index >= len(path) - 1:
-            self.draw_entities(path[-1])
-            self.show_success()
-            return
-            
-        current_state = path[index]
-        next_state = path[index+1]
-        
-        self.start_transition(current_state, next_state, path, index)
-
-    def start_transition(self, curr_state, next_state, path, index):
-        # Determine movement details
-        c_m, c_c, c_b = curr_state
-        n_m, n_c, n_b = next_state
-        
-        m_moved_count = abs(c_m - n_m)
-        c_moved_count = abs(c_c - n_c)
-        direction = "LtoR" if c_b == 1 else "RtoL"
-        
-        passengers = []
-        # Identify who moves (simplification: take from end of lists)
-        # We need (type, from_pos, to_pos)
-        
-        # Boat seats (indices)
-        seat_indices = []
-        if m_moved_count + c_moved_count == 1:
-            seat_indices = [0] # Center-ish? Or use 0 (left seat)
-        elif m_moved_count + c_moved_count == 2:
-            seat_indices = [0, 1]
-            
-        # Assign seats
-        seat_idx = 0
-        
-        # Source Bank Counts (for coordinate calculation)
-        if direction == "LtoR":
-            # Leaving Left Bank
-            # Missionaries taking last spots
-            src_m_start_idx = c_m - m_moved_count
-            src_c_start_idx = c_c - c_moved_count
-            bank_side = "left"
-        else:
-            # Leaving Right Bank
-            src_m_start_idx = (3-c_m) - m_moved_count # Right bank M count = 3 - c_m
-            src_c_start_idx = (3-c_c) - c_moved_count
-            bank_side = "right"
-
-        # Build movement list
-        # Each item: {"type": "M" or "C", "bank_idx": int, "seat_idx": int}
-        movers = []
-        
-        for i in range(m_moved_count):
-            movers.append({"type": "M", "bank_idx": src_m_start_idx + i, "seat_idx": seat_indices[seat_idx]})
-            seat_idx += 1
-            
-        for i in range(c_moved_count):
-            movers.append({"type": "C", "bank_idx": src_c_start_idx + i, "seat_idx": seat_indices[seat_idx]})
-            seat_idx += 1
-
-        # Move Description
-        parts = []
-        if m_moved_count > 0:
-            parts.append(f"{m_moved_count} Missionary" if m_moved_count == 1 else f"{m_moved_count} Missionaries")
-        if c_moved_count > 0:
-            parts.append(f"{c_moved_count} Cannibal" if c_moved_count == 1 else f"{c_moved_count} Cannibals")
-            
-        move_text_content = ", ".join(parts)
-        if direction == "LtoR":
-            move_text = f"{move_text_content} -> Right"
-        else:
-            move_text = f"Left <- {move_text_content}"
-
-        # Phase 1: Embark
-        self.run_embark(curr_state, next_state, movers, direction, 0.0, path, index, move_text)
+        frame_start = time.perf_counter()
+        if not self.is_paused:
+            self.anim_time += (frame_start - self.anim_last_tick) * self.playback_speed
+        self.anim_last_tick = frame_start
 
-    def run_embark(self, curr_state, next_state, movers, direction, progress, path, index, move_text):
-        if not self.is_animating: return
-        if self.is_paused:
-            self.root.after(100, lambda: self.run_embark(curr_state, next_state, movers, direction, progress, path, index, move_text))
+        index = self.draw_timeline_frame(self.anim_path, self.anim_time)
+        if index is None:
+            self.update_playback_label(len(self.anim_path) - 1)
+            self.show_success()
             return
+        self.update_playback_label(index + 1)
 
-        if progress > 1.0: progress = 1.0
-        
-        # Draw Embarking
-        self.draw_scene_phase("embark", curr_state, movers, direction, progress, move_text)
-        
-        if progress < 1.0:
-            self.root.after(20, lambda: self.run_embark(curr_state, next_state, movers, direction, progress + 0.05, path, index, move_text))
-        else:
-            # Done, start Crossing
-            self.run_cross(curr_state, next_state, movers, direction, 0.0, path, index, move_text)
+        elapsed_ms = (time.perf_counter() - frame_start) * 1000
+        self.root.after(max(1, int(FRAME_MS - elapsed_ms)), self.animation_tick)
 
-    def run_cross(self, curr_state, next_state, movers, direction, progress, path, index, move_text):
-        if not self.is_animating: return
-        if self.is_paused:
-            self.root.after(100, lambda: self.run_cross(curr_state, next_state, movers, direction, progress, path, index, move_text))
-            return
+    def update_playback_label(self, move):
+        if self.playback_label_id is not None:
+            self.canvas.itemconfig(self.playback_label_id,
+                                   text=f"Move {move}/{len(self.anim_path) - 1}  {self.playback_speed:g}x")
 
-        if progress > 1.0: progress = 1.0
-        
-        self.draw_scene_phase("cross", curr_state, movers, direction, progress, move_text)
-        
-        if progress < 1.0:
-            self.root.after(20, lambda: self.run_cross(curr_state, next_state, movers, direction, progress + 0.02, path, index, move_text))
-        else:
-            self.run_disembark(curr_state, next_state, movers, direction, 0.0, path, index, move_text)
+    def change_speed(self, delta):
+        i = PLAYBACK_SPEEDS.index(self.playback_speed) if self.playback_speed in PLAYBACK_SPEEDS else 2
+        self.playback_speed = PLAYBACK_SPEEDS[max(0, min(len(PLAYBACK_SPEEDS) - 1, i + delta))]
+        self.last_frame = None
 
-    def run_disembark(self, curr_state, next_state, movers, direction, progress, path, index, move_text):
-        if not self.is_animating: return
-        if self.is_paused:
-            self.root.after(100, lambda: self.run_disembark(curr_state, next_state, movers, direction, progress, path, index, move_text))
+    def ask_jump_to_step(self):
+        steps = len(self.anim_path) - 1
+        if steps < 1:
             return
-
-        if progress > 1.0: progress = 1.0
-        
-        self.draw_scene_phase("disembark", curr_state, movers, direction, progress, move_text)
-        
-        if progress < 1.0:
-            self.root.after(20, lambda: self.run_disembark(curr_state, next_state, movers, direction, progress + 0.05, path, index, move_text))
-        else:
-            # Finished full step
-            self.animate_sequence(path, index + 1)
-
-    def draw_scene_phase(self, phase, state, movers, direction, progress, move_text=""):
-        self.canvas.delete("entity")
-        
-        # Draw Move Text in Sky
-        if move_text:
-            self.canvas.create_text(400, 280, text=move_text, font=("Helvetica", 16, "bold"), fill="black", tags="entity")
-        
-        m_left, c_left, boat_pos = state
-        
-        # Static counts (What remains on bank throughout)
-        # Assuming movers are "removed" from state for drawing
-        # If phase is embark, they are moving from bank to boat.
-        # So static = original - moving
-        
-        num_m_moving = len([x for x in movers if x["type"] == "M"])
-        num_c_moving = len([x for x in movers if x["type"] == "C"])
-        
-        # Calculate Static Entities on Banks
-        if direction == "LtoR":
-            static_m_l = m_left - num_m_moving
-            static_c_l = c_left - num_c_moving
-            static_m_r = 3 - m_left
-            static_c_r = 3 - c_left
-            boat_start_x = 260
-            boat_end_x = 540
-            bank_side = "left" # source
-        else:
-            # RtoL
-            static_m_l = m_left
-            static_c_l = c_left
-            static_m_r = (3 - m_left) - num_m_moving # Right bank has total 3-m_left. 
-            static_c_r = (3 - c_left) - num_c_moving
-            boat_start_x = 540
-            boat_end_x = 260
-            bank_side = "right" # source
-
-        # 1. Draw Static Groups
-        self.draw_group(100, 350, static_m_l, static_c_l)
-        self.draw_group(700, 350, static_m_r, static_c_r)
-        
-        # 2. Draw Boat
-        boat_y = 500
-        if phase == "embark":
-            boat_x = boat_start_x
-        elif phase == "disembark":
-            boat_x = boat_end_x
-        else: # cross
-            boat_x = boat_start_x + (boat_end_x - boat_start_x) * progress
-
-        self.draw_boat(boat_x, boat_y)
-        
-        # 3. Draw Movers
-        for mover in movers:
-            char_type = mover["type"]
-            bank_idx = mover["bank_idx"]
-            seat_idx = mover["seat_idx"]
-            
-            # Get Coordinates
-            # Boat Seat Coords (Relative to boat center)
-            offsets = [-20, 20] 
-            offset = offsets[seat_idx] if seat_idx < len(offsets) else 0
-            seat_x = boat_x + offset
-            seat_y = boat_y - 20
-            
-            # Bank Coords
-            bx, by = self.get_bank_coords(bank_side if phase != "disembark" else ("right" if bank_side=="left" else "left"), 
-                                          char_type, bank_idx)
-            
-            # If Disembarking, destination is opposite bank
-            # Logic check:
-            # Embark: Source Bank -> Boat (Boat Static)
-            # Cross: Boat -> Boat (Passenger Fixed on Boat)
-            # Disembark: Boat -> Dest Bank (Boat Static)
-            
-            draw_x, draw_y = 0, 0
-            
-            if phase == "embark":
-                # Interp Bank -> Seat
-                bx, by = self.get_bank_coords(bank_side, char_type, bank_idx)
-                
-                # Ease out
-                t = progress
-                draw_x = bx + (seat_x - bx) * t
-                draw_y = by + (seat_y - by) * t
-                
-            elif phase == "cross":
-                # Fixed values on boat
-                draw_x = seat_x
-                draw_y = seat_y
-                
-            elif phase == "disembark":
-                # Interp Left Seat -> Right Bank
-                dest_side = "right" if direction == "LtoR" else "left"
-                
-                # We need destination index.
-                # If LtoR, moving to Right Bank. existing right bank has static_m_r.
-                # So new items append after static_m_r.
-                # Actually, simplistic view: just append to end of existing list on dest.
-                
-                # We need to map *which* mover goes to *which* dest index.
-                # Simple stack: if type M, index = static_m_dest + (0, 1..)
-                # But we are iterating movers. We need to know order.
-                # Let's recalculate dest index on fly or precalc.
-                
-                # Hacky: Assume calculate dest_idx based on current static + order in movers
-                # But movers mixed M/C.
-                # Let's count seen Ms and Cs in this loop? No, that resets every frame.
-                # Use mover list index?
-                pass
-                
-                # Better: calculate dest_idx dynamically
-                if char_type == "M":
-                    # How many Ms before me in movers?
-                    my_m_order = len([m for m in movers[:movers.index(mover)] if m["type"]=="M"])
-                    
-                    if dest_side == "right": dest_start = static_m_r
-                    else: dest_start = static_m_l
-                    
-                    dest_idx = dest_start + my_m_order
-                else:
-                    my_c_order = len([m for m in movers[:movers.index(mover)] if m["type"]=="C"])
-                    if dest_side == "right": dest_start = static_c_r
-                    else: dest_start = static_c_l
-                    dest_idx = dest_start + my_c_order
-                
-                bx, by = self.get_bank_coords(dest_side, char_type, dest_idx)
-                
-                t = progress
-                draw_x = seat_x + (bx - seat_x) * t
-                draw_y = seat_y + (by - seat_y) * t
-            
-            self.draw_character(draw_x, draw_y, char_type, COLOR_MISSIONARY if char_type=="M" else COLOR_CANNIBAL)
-
-    def get_bank_coords(self, side, char_type, index):
-        # 100, 350
-        if side == "left":
-            base_x = 100
-        else:
-            base_x = 700
-            
-        spacing = 30
-        
-        # M: start_y = 350
-        # C: start_y = 450
-        
-        start_y = 350 if char_type == "M" else 450
-        
-        x = base_x - 50 + (index % 3) * spacing
-        y = start_y + (index // 3) * 60
-        
-        return x, y
-
-    def draw_boat(self, x, y):
-        # Draw realistic boat (Wooden Trapezoid)
-        # Hull
-        hull_points = [x-60, y-10, x+60, y-10, x+40, y+20, x-40, y+20]
-        self.canvas.create_polygon(hull_points, fill=COLOR_BOAT, outline="black", width=2, tags="entity")
-        
-        # Wood planks details
-        self.canvas.create_line(x-55, y, x+55, y, fill="#5C3317", width=1, tags="entity")
-        self.canvas.create_line(x-48, y+10, x+48, y+10, fill="#5C3317", width=1, tags="entity")
-        
-        # Label
-        self.canvas.create_text(x, y+5, text="BOAT", fill="white", font=("Arial", 8, "bold"), tags="entity")
-
-
-    def draw_group(self, bank_x, start_y, m_count, c_count):
-        spacing = 30
-        # Draw Ms
-        for i in range(m_count):
-            x = bank_x - 50 + (i % 3) * spacing
-            y = start_y + (i // 3) * 60
-            self.draw_character(x, y, "M", COLOR_MISSIONARY)
-            
-        # Draw Cs
-        for i in range(c_count):
-            x = bank_x - 50 + (i % 3) * spacing
-            y = start_y + 100 + (i // 3) * 60
-            self.draw_character(x, y, "C", COLOR_CANNIBAL)
+        step = simpledialog.askinteger("Jump to step", f"Move number (1-{steps}):",
+                                       minvalue=1, maxvalue=steps, parent=self.root)
+        if step is not None:
+            self.jump_to_step(step - 1)
+
+    def jump_to_step(self, index):
+        """Seek to the start of move `index` (0-based), resuming playback if it had finished."""
+        self.anim_time = max(0, min(index, len(self.anim_path) - 1)) * STEP_SEC
+        self.last_frame = None
+        if not self.is_animating and self.anim_path:
+            self.canvas.delete("overlay")
+            self.canvas.delete("menu_btn")
+            self.is_animating = True
+            self.anim_last_tick = time.perf_counter()
+            self.animation_tick()
 
     def show_success(self):
         self.is_animating = False
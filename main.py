@@ -1,54 +1,139 @@
 """
 Main runner for the River Crossing Problem Solver.
-Executes all five search algorithms and displays a comparative summary.
+Executes the search algorithms in parallel and displays a comparative summary.
+
+With no arguments it compares the six default algorithms on the classic
+3/3/2 instance. Flags select the algorithms, instance, heuristic, repeat
+count and output format, so runs can be scripted:
+
+    python main.py --algorithms A* IDA* --size 100,100,4 --heuristic pdb
+    python main.py --size 20,20,4 --repeat 10 --json > results.json
+    python main.py --algorithms "Weighted A*" ARA* Beam --size 1000,500,2 --time-limit 0.5
 """
 
-from search.bfs import solve as bfs_solve
-from search.dfs import solve as dfs_solve
-from search.astar import solve as astar_solve
-from search.greedy import solve as greedy_solve
-from search.csp import solve as csp_solve
+import argparse
+from functools import partial
+import json
+import statistics
+import sys
+from typing import Dict, List, Optional
+
+from search.registry import DEFAULT_ALGORITHMS, HEURISTIC_NAMES, SOLVER_MODULES, parse_size, solvers
+
+from core.river_crossing import Problem
+from core.parallel import solve_parallel
+from core.solution_cache import Result, SolutionCache
+
+# Seconds each solver may run before it is reported as timed out
+SOLVER_TIMEOUT = 60.0
 
-from core.river_crossing import GOAL_STATE
 
+def _solve_repeated(solver, repeat: int, problem: Problem) -> Result:
+    """Run `solver` `repeat` times in one worker; the reported time is the median run."""
+    runs = [solver(problem) for _ in range(repeat)]
+    path, nodes, _ = runs[-1]
+    return path, nodes, statistics.median(time_ms for _, _, time_ms in runs)
 
-def print_solution_summary(algo_name: str, path, nodes_explored=0, time_sec=0.0):
+
+def print_solution_summary(algo_name: str, path, nodes_explored=0, time_ms=0.0):
     path_length = len(path) - 1  # number of moves
-    print(f"{algo_name:<18} | {path_length:<12} | {nodes_explored:<15} | {time_sec * 1000:<10.2f}")
-
-
-def main():
-    print("Running all search algorithms for the Missionaries and Cannibals problem...\n")
-
-    # Run each solver
-    bfs_path, bfs_nodes, bfs_time = bfs_solve()
-    dfs_path, dfs_nodes, dfs_time = dfs_solve()
-    astar_path, astar_nodes, astar_time = astar_solve()
-    greedy_path, greedy_nodes, greedy_time = greedy_solve()
-    csp_path, csp_nodes, csp_time = csp_solve()
-
-    # Validate all found the goal
-    all_paths = [bfs_path, dfs_path, astar_path, greedy_path, csp_path]
-    for i, path in enumerate(all_paths):
-        final_state = None
-        if path:
-            final_state = path[-1]
-
-        if not path or final_state != GOAL_STATE:
-            algo_names = ["BFS", "DFS", "A*", "Greedy", "CSP"]
-            print(f"⚠️  Warning: {algo_names[i]} did not reach the goal state!")
-
-    # Print results table
-    print(f"{'Algorithm':<18} | {'Path Length':<12} | {'Nodes Explored':<15} | {'Time (ms)':<10}")
-    print("-" * 70)
-    print_solution_summary("BFS", bfs_path, bfs_nodes, bfs_time)
-    print_solution_summary("DFS", dfs_path, dfs_nodes, dfs_time)
-    print_solution_summary("A*", astar_path, astar_nodes, astar_time)
-    print_solution_summary("Greedy", greedy_path, greedy_nodes, greedy_time)
-    print_solution_summary("CSP", csp_path, csp_nodes, csp_time)
+    print(f"{algo_name:<18} | {path_length:<12} | {nodes_explored:<15} | {time_ms:<10.2f}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Compare the River Crossing Problem solvers.")
+    parser.add_argument("--algorithms", nargs="+", default=list(DEFAULT_ALGORITHMS), choices=list(SOLVER_MODULES),
+                        metavar="ALGO", help=f"algorithms to run, from {', '.join(SOLVER_MODULES)} "
+                                             f"(default: {' '.join(DEFAULT_ALGORITHMS)})")
+    parser.add_argument("--size", type=parse_size, default=Problem(), metavar="M,C,CAPACITY",
+                        help="problem instance (default: 3,3,2)")
+    parser.add_argument("--heuristic", choices=HEURISTIC_NAMES, default=None,
+                        help="heuristic for A*, Greedy and IDA*")
+    parser.add_argument("--weight", type=float, default=None,
+                        help="heuristic weight for Weighted A* and initial weight for ARA*")
+    parser.add_argument("--beam-width", type=int, default=None, help="states kept per layer by Beam")
+    parser.add_argument("--time-limit", type=float, default=None, metavar="SEC",
+                        help="Weighted A*, ARA* and Beam stop after this long and return their best path so far")
+    parser.add_argument("--frontier", choices=["heap", "bucket"], default=None,
+                        help="priority queue used by A* and Greedy (default: heap)")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="solve each algorithm this many times and report the median time; "
+                             "more than 1 bypasses the cache (default: 1)")
+    parser.add_argument("--timeout", type=float, default=SOLVER_TIMEOUT,
+                        help=f"seconds per algorithm before it is reported as timed out (default: {SOLVER_TIMEOUT:g})")
+    parser.add_argument("--no-cache", action="store_true", help="do not read or write the solution cache")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON instead of a table")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    problem = args.size
+    options = {key: value for key, value in (("weight", args.weight), ("width", args.beam_width),
+                                             ("time_limit", args.time_limit), ("frontier", args.frontier))
+               if value is not None}
+    selected: Dict = solvers(args.algorithms, args.heuristic, **options)
+    heuristics = {name: solver.heuristic for name, solver in selected.items()}
+    if args.repeat > 1:
+        selected = {name: partial(_solve_repeated, solver, args.repeat) for name, solver in selected.items()}
+
+    if not args.json:
+        print("Running all search algorithms for the Missionaries and Cannibals problem...\n")
+        print(f"{'Algorithm':<18} | {'Path Length':<12} | {'Nodes Explored':<15} | {'Time (ms)':<10}")
+        print("-" * 70)
+
+    # Solvers run in parallel worker processes (or come from the on-disk
+    # cache); rows are printed in the order they finish
+    warnings = []
+    records = []
+    # The cache is keyed by algorithm and heuristic only, so runs with other
+    # knobs are not cached
+    cache = None if args.no_cache or args.repeat > 1 or options else SolutionCache()
+    try:
+        for name, result, error in solve_parallel(selected, problem, timeout=args.timeout, cache=cache):
+            record = {"algorithm": name, "heuristic": heuristics[name]}
+            records.append(record)
+
+            if error is not None:
+                record["error"] = f"{type(error).__name__}: {error}"
+                warnings.append(name)
+                if not args.json:
+                    print(f"{name:<18} | {type(error).__name__}: {error}")
+                continue
+
+            path, nodes, time_ms = result
+            solved = bool(path) and problem.is_goal(path[-1])
+            record.update({"path_length": len(path) - 1 if solved else None, "nodes": nodes,
+                           "time_ms": time_ms, "path": [list(state) for state in path] if solved else None})
+            if not solved:
+                warnings.append(name)
+                if not args.json:
+                    print(f"{name:<18} | {'Fail':<12} | {nodes:<15} | {time_ms:<10.2f}")
+                continue
+            if not args.json:
+                print_solution_summary(name, path, nodes, time_ms)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    if args.json:
+        instance = {"m": problem.n_missionaries, "c": problem.n_cannibals, "capacity": problem.boat_capacity}
+        json.dump({"problem": instance, "repeat": args.repeat, "results": records}, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return 1 if warnings else 0
+
+    if warnings:
+        print()
+    for name in warnings:
+        print(f"⚠️  Warning: {name} did not reach the goal state!")
 
     print("\n✅ All algorithms executed.")
+    return 1 if warnings else 0
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -1,17 +1,20 @@
 """
 Interactive runner for the River Crossing Problem Solver.
-Allows the user to select and run one of the five search algorithms.
+Allows the user to select and run one of the search algorithms, and prints
+the solution step by step.
+
+Pass --algorithm to skip the menu, e.g.:
+
+    python main_2.py --algorithm A* --size 5,5,3 --heuristic pdb
 """
 
+import argparse
 import sys
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-# Import all solvers
-from search.bfs import solve as bfs_solve
-from search.dfs import solve as dfs_solve
-from search.astar import solve as astar_solve
-from search.greedy import solve as greedy_solve
-from core.river_crossing import GOAL_STATE, INITIAL_STATE, MOVES
+from search.registry import HEURISTIC_ALGORITHMS, HEURISTIC_NAMES, SOLVER_MODULES, get_solver, parse_size
+from core.river_crossing import Problem
+from core.solution_cache import SolutionCache
 
 
 def reconstruct_moves(path: List[Tuple[int, int, int]]) -> List[Tuple[int, int]]:
@@ -30,12 +33,12 @@ def reconstruct_moves(path: List[Tuple[int, int, int]]) -> List[Tuple[int, int]]
     return moves
 
 
-def print_solution(path: List[Tuple[int, int, int]], nodes_explored: int = 0, time_sec: float = 0.0):
+def print_solution(path: List[Tuple[int, int, int]], nodes_explored: int = 0, time_ms: float = 0.0):
     if not path:
         print("❌ No solution found.")
         return
 
-    print(f"\n✅ Solution found! Goal state reached: {GOAL_STATE}")
+    print(f"\n✅ Solution found! Goal state reached: {path[-1]}")
     print("-" * 70)
 
     # Reconstruct moves
@@ -44,7 +47,7 @@ def print_solution(path: List[Tuple[int, int, int]], nodes_explored: int = 0, ti
     # Print step-by-step (as in your Phase 1 doc)
     print(f"{'Step':<5} {'State (M_L, C_L, B)':<20} {'Move (M, C)':<15} {'Action'}")
     print("-" * 70)
-    print(f"{0:<5} {str(INITIAL_STATE):<20} {'-':<15} Start")
+    print(f"{0:<5} {str(path[0]):<20} {'-':<15} Start")
 
     for i, (state, move) in enumerate(zip(path[1:], moves), start=1):
         M_L, C_L, B = state
@@ -57,41 +60,64 @@ def print_solution(path: List[Tuple[int, int, int]], nodes_explored: int = 0, ti
     print("\n📊 Performance Metrics:")
     print(f"  • Path Length (moves): {path_length}")
     print(f"  • Nodes Explored: {nodes_explored}")
-    print(f"  • Execution Time: {time_sec * 1000:.2f} ms")
+    print(f"  • Execution Time: {time_ms:.2f} ms")
 
 
-def main():
-    algorithms = {
-        "1": ("BFS", bfs_solve),
-        "2": ("DFS", dfs_solve),
-        "3": ("A*", astar_solve),
-        "4": ("Greedy", greedy_solve),
-    }
+def choose_algorithm() -> Optional[str]:
+    """Ask for an algorithm on stdin; returns None on an invalid choice."""
+    algorithms = dict(enumerate(SOLVER_MODULES, start=1))
 
     print("🌊 River Crossing Problem Solver")
     print("Select a search algorithm to run:\n")
 
-    for key, (name, _) in algorithms.items():
+    for key, name in algorithms.items():
         print(f"  {key}. {name}")
 
-    choice = input("\nEnter your choice (1–4): ").strip()
+    choice = input(f"\nEnter your choice (1–{len(algorithms)}): ").strip()
 
-    if choice not in algorithms:
-        print("❌ Invalid choice. Please run again and select 1–4.")
-        return
+    if not choice.isdigit() or int(choice) not in algorithms:
+        print(f"❌ Invalid choice. Please run again and select 1–{len(algorithms)}.")
+        return None
+    return algorithms[int(choice)]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Solve the River Crossing Problem and print the moves.")
+    parser.add_argument("--algorithm", choices=list(SOLVER_MODULES), metavar="ALGO",
+                        help=f"algorithm to run, from {', '.join(SOLVER_MODULES)} (default: ask)")
+    parser.add_argument("--size", type=parse_size, default=Problem(), metavar="M,C,CAPACITY",
+                        help="problem instance (default: 3,3,2)")
+    parser.add_argument("--heuristic", choices=HEURISTIC_NAMES, default=None,
+                        help="heuristic for A*, Greedy and IDA*")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
 
-    algo_name, solver = algorithms[choice]
+    algo_name = args.algorithm or choose_algorithm()
+    if algo_name is None:
+        return 1
+    if args.heuristic and algo_name not in HEURISTIC_ALGORITHMS:
+        parser.error(f"{algo_name} does not take a heuristic")
+    solver = get_solver(algo_name, args.heuristic)
 
     print(f"\n▶️  Running {algo_name}...\n")
 
+    cache = SolutionCache()
     try:
-        path, nodes_explored, time_sec = solver()
-        print_solution(path, nodes_explored, time_sec)
+        path, nodes_explored, time_ms = cache.solve(algo_name, solver, args.size, heuristic=args.heuristic)
+        print_solution(path, nodes_explored, time_ms)
     except Exception as e:
         print(f"❌ Error while running {algo_name}: {e}")
         import traceback
         traceback.print_exc()
+        return 1
+    finally:
+        cache.close()
+    return 0 if path else 1
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,298 @@
+"""
+Headless rendering of solution animations for the River Crossing Problem.
+
+Solves an instance and renders the same scene the GUI animates (see
+scene.SceneRenderer) to a PNG frame sequence or an animated GIF, with no
+display required. Frames are split into contiguous ranges that are rendered
+in parallel worker processes.
+
+Requires the optional Pillow library (`pip install pillow`).
+
+Examples:
+    python render.py --out frames/
+    python render.py --algorithm A* --size 5,5,3 --gif solution.gif --fps 20
+    python render.py --gif solution.gif --speed 4 --workers 8
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from functools import lru_cache
+import math
+import os
+import sys
+import tempfile
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from search.registry import SOLVER_MODULES, get_solver, parse_size
+
+from core.river_crossing import Problem, State
+from scene import STEP_SEC, SceneRenderer
+
+WIDTH, HEIGHT = 800, 600
+
+# Palette size of GIF frames; the scene uses few flat colors plus text edges
+GIF_COLORS = 64
+
+# Tk anchors used by the scene → Pillow text anchors
+_ANCHORS = {"center": "mm", "w": "lm", "e": "rm", "n": "mt", "s": "mb"}
+
+
+@lru_cache(maxsize=None)
+def _font(size: int, bold: bool):
+    from PIL import ImageFont
+
+    name = "DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf"
+    try:
+        return ImageFont.truetype(name, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+class ImageCanvas:
+    """
+    The subset of the tk.Canvas API that SceneRenderer uses, recorded as a
+    display list and rasterized with Pillow by `render`.
+    """
+
+    def __init__(self, width: int = WIDTH, height: int = HEIGHT):
+        self.width = width
+        self.height = height
+        # item id -> [kind, coords, options, tags]; ids grow, so dict order is stacking order
+        self._items = {}
+        self._next_id = 1
+
+    def _create(self, kind: str, coords, options) -> int:
+        if len(coords) == 1 and isinstance(coords[0], (list, tuple)):
+            coords = coords[0]
+        tags = options.pop("tags", ())
+        if isinstance(tags, str):
+            tags = (tags,)
+        item_id = self._next_id
+        self._next_id += 1
+        self._items[item_id] = [kind, [float(c) for c in coords], options, tuple(tags)]
+        return item_id
+
+    def create_rectangle(self, *coords, **options) -> int:
+        return self._create("rectangle", coords, options)
+
+    def create_oval(self, *coords, **options) -> int:
+        return self._create("oval", coords, options)
+
+    def create_polygon(self, *coords, **options) -> int:
+        return self._create("polygon", coords, options)
+
+    def create_line(self, *coords, **options) -> int:
+        return self._create("line", coords, options)
+
+    def create_text(self, *coords, **options) -> int:
+        return self._create("text", coords, options)
+
+    def _find(self, tag_or_id) -> List[int]:
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self._items else []
+        if tag_or_id == "all":
+            return list(self._items)
+        return [item_id for item_id, item in self._items.items() if tag_or_id in item[3]]
+
+    def delete(self, tag_or_id) -> None:
+        for item_id in self._find(tag_or_id):
+            del self._items[item_id]
+
+    def move(self, tag_or_id, dx: float, dy: float) -> None:
+        for item_id in self._find(tag_or_id):
+            coords = self._items[item_id][1]
+            for i in range(0, len(coords), 2):
+                coords[i] += dx
+                coords[i + 1] += dy
+
+    def itemconfig(self, tag_or_id, **options) -> None:
+        for item_id in self._find(tag_or_id):
+            self._items[item_id][2].update(options)
+
+    def render(self):
+        """Rasterize the current display list to a PIL image."""
+        from PIL import Image, ImageDraw
+
+        image = Image.new("RGB", (self.width, self.height), "white")
+        draw = ImageDraw.Draw(image)
+
+        for kind, coords, options, _ in self._items.values():
+            width = int(options.get("width", 1))
+            if kind == "text":
+                text = options.get("text", "")
+                if not text:
+                    continue
+                family_size_style = options.get("font", ("Helvetica", 12))
+                bold = "bold" in family_size_style[2:]
+                draw.text(coords, text, fill=options.get("fill", "black"),
+                          font=_font(int(family_size_style[1]), bold),
+                          anchor=_ANCHORS.get(options.get("anchor", "center"), "mm"))
+            elif kind == "line":
+                draw.line(coords, fill=options.get("fill", "black"), width=width)
+            else:
+                # Tk defaults: rectangles/ovals are outlined in black, polygons are not
+                fill = options.get("fill") or None
+                outline = options.get("outline", "" if kind == "polygon" else "black") or None
+                if kind == "rectangle":
+                    draw.rectangle(coords, fill=fill, outline=outline, width=width)
+                elif kind == "oval":
+                    draw.ellipse(coords, fill=fill, outline=outline, width=width)
+                else:
+                    draw.polygon(coords, fill=fill, outline=outline, width=width)
+
+        return image
+
+
+class HeadlessScene(SceneRenderer):
+    """The GUI scene for one problem, drawn onto an ImageCanvas."""
+
+    def __init__(self, problem: Problem, title: str = ""):
+        self.problem = problem
+        self.canvas = ImageCanvas()
+        self.draw_background()
+        if title:
+            self.canvas.create_text(400, 30, text=title, font=("Helvetica", 20, "bold"), fill="white")
+        self.clear_scene()
+
+
+def frame_count(path: Sequence[State], fps: float, speed: float = 1.0) -> int:
+    """Frames needed to play `path` at `fps`, plus one showing the final state."""
+    return math.ceil((len(path) - 1) * STEP_SEC / speed * fps) + 1
+
+
+def _shared_palette(problem: Problem, path: List[State], title: str):
+    """
+    Palette image for paletted frames. It is derived from a mid-crossing
+    frame (every sprite on screen), so each worker computes the same one.
+    """
+    scene = HeadlessScene(problem, title)
+    scene.draw_timeline_frame(path, STEP_SEC / 2)
+    return scene.canvas.render().quantize(colors=GIF_COLORS)
+
+
+def _render_range(problem_key: Tuple[int, int, int], path: List[State], title: str,
+                  start: int, stop: int, fps: float, speed: float, out_dir: str,
+                  paletted: bool) -> List[str]:
+    """Render frames [start, stop) in one process; returns the written file names."""
+    from PIL import Image
+
+    problem = Problem(*problem_key)
+    palette = _shared_palette(problem, path, title) if paletted else None
+    scene = HeadlessScene(problem, title)
+    written = []
+    for frame in range(start, stop):
+        scene.draw_timeline_frame(path, frame / fps * speed)
+        image = scene.canvas.render()
+        if palette is not None:
+            image = image.quantize(palette=palette, dither=Image.Dither.NONE)
+        file_path = os.path.join(out_dir, f"frame_{frame:05d}.png")
+        # Fast zlib level: frames are intermediate files, encoding dominates otherwise
+        image.save(file_path, compress_level=1)
+        written.append(file_path)
+    return written
+
+
+def render_frames(path: Sequence[State], problem: Problem, out_dir: str,
+                  fps: float = 25, speed: float = 1.0, title: str = "",
+                  workers: Optional[int] = None, paletted: bool = False) -> List[str]:
+    """
+    Render the animation of `path` to out_dir/frame_NNNNN.png.
+
+    The frame range is cut into one contiguous chunk per worker process so
+    each worker keeps its retained scene between consecutive frames;
+    workers <= 1 renders in this process. With `paletted`, frames are
+    quantized to one shared palette in the workers, which makes `write_gif`
+    a plain encode instead of a serial per-frame quantization.
+
+    Returns:
+        list: the frame file paths in playback order
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    total = frame_count(path, fps, speed)
+    workers = min(total, (os.cpu_count() or 1) if workers is None else max(1, workers))
+    path = list(path)
+
+    bounds = [total * i // workers for i in range(workers + 1)]
+    jobs = [(problem.key, path, title, bounds[i], bounds[i + 1], fps, speed, out_dir, paletted)
+            for i in range(workers)]
+
+    if workers == 1:
+        return _render_range(*jobs[0])
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_render_range, *job) for job in jobs]
+        return [file_path for future in futures for file_path in future.result()]
+
+
+def write_gif(frame_paths: Sequence[str], gif_path: str, fps: float = 25) -> None:
+    """Assemble rendered PNG frames into a looping animated GIF."""
+    from PIL import Image
+
+    def open_frames(paths: Sequence[str]) -> Iterator["Image.Image"]:
+        # One frame file open at a time: Pillow copies each frame as it reads it
+        for path in paths:
+            with Image.open(path) as frame:
+                yield frame
+
+    first, *rest = frame_paths
+    frames = open_frames(rest)
+    with Image.open(first) as image, closing(frames):
+        image.save(gif_path, save_all=True, append_images=frames,
+                   duration=round(1000 / fps), loop=0, optimize=False)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Render a solution animation to image frames without a display.")
+    parser.add_argument("--algorithm", default="BFS", choices=list(SOLVER_MODULES), help="solver to animate (default: BFS)")
+    parser.add_argument("--size", type=parse_size, default=Problem(), metavar="M,C,CAPACITY",
+                        help="problem instance (default: 3,3,2)")
+    parser.add_argument("--out", help="directory for the PNG frames")
+    parser.add_argument("--gif", help="write an animated GIF here")
+    parser.add_argument("--fps", type=float, default=25, help="frames per second (default: 25)")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback speed multiplier (default: 1)")
+    parser.add_argument("--workers", type=int, default=None, help="render processes (default: CPU count)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.out and not args.gif:
+        parser.error("give --out and/or --gif")
+    if args.fps <= 0 or args.speed <= 0:
+        parser.error("--fps and --speed must be positive")
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("render.py needs Pillow: pip install pillow", file=sys.stderr)
+        return 2
+
+    problem = args.size
+    path, nodes, time_ms = get_solver(args.algorithm)(problem)
+    if not path:
+        print(f"{args.algorithm} found no solution for {problem!r}", file=sys.stderr)
+        return 1
+
+    title = f"Algorithm: {args.algorithm}"
+    print(f"{args.algorithm}: {len(path) - 1} moves, rendering {frame_count(path, args.fps, args.speed)} frames...",
+          file=sys.stderr)
+
+    if args.out:
+        frames = render_frames(path, problem, args.out, args.fps, args.speed, title, args.workers)
+        print(f"Wrote {len(frames)} frames to {args.out}", file=sys.stderr)
+        if args.gif:
+            write_gif(frames, args.gif, args.fps)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            frames = render_frames(path, problem, tmp, args.fps, args.speed, title, args.workers, paletted=True)
+            write_gif(frames, args.gif, args.fps)
+
+    if args.gif:
+        print(f"Wrote {args.gif}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,400 @@
+"""
+Scene drawing shared by the Tk GUI and the headless renderer.
+
+`SceneRenderer` draws the river, banks, boat and characters onto
+`self.canvas`, which only needs the subset of the Tk canvas API used here
+(create_* with tags, move, itemconfig, delete). `gui.RiverCrossingApp` mixes
+it in with a real tk.Canvas; `render.py` uses it with an image-backed canvas.
+
+An animation is a timeline of STEP_SEC seconds (at 1x speed) per move:
+embark, cross, disembark. `draw_timeline_frame` draws the scene at any point
+of that timeline.
+"""
+
+# Colors
+COLOR_SKY = "#87CEEB"
+COLOR_RIVER = "#4682B4"
+COLOR_LAND = "#228B22"
+COLOR_BOAT = "#8B4513"
+COLOR_MISSIONARY = "#FFD700"  # Gold
+COLOR_CANNIBAL = "#FF4500"    # OrangeRed
+COLOR_TEXT = "#FFFFFF"
+
+# Animation timeline (seconds of playback at 1x per move)
+EMBARK_SEC = 0.4
+CROSS_SEC = 1.0
+DISEMBARK_SEC = 0.4
+STEP_SEC = EMBARK_SEC + CROSS_SEC + DISEMBARK_SEC
+
+
+class SceneRenderer:
+    """
+    Mixin drawing the scene of `self.problem` onto `self.canvas`.
+
+    Entities are retained: `self.sprite_positions` maps sprite tags to their
+    current position and frames only move them (see `place_sprite`). Call
+    `clear_scene` before drawing the first frame of an animation.
+    """
+
+    move_text_id = None
+    anim_plan = None
+    last_frame = None
+
+    def draw_timeline_frame(self, path, anim_time):
+        """
+        Draw the scene `anim_time` seconds (at 1x) into the playback of `path`.
+
+        Returns the 0-based index of the move shown, or None once the
+        timeline is over (the final state is drawn then).
+        """
+        steps = len(path) - 1
+        index = int(anim_time // STEP_SEC)
+        if index >= steps:
+            self.draw_entities(path[-1])
+            return None
+
+        phase, progress = self.phase_at(anim_time - index * STEP_SEC)
+        frame = (index, phase, progress)
+        if frame != self.last_frame:
+            if self.anim_plan is None or self.anim_plan[0] != index:
+                self.anim_plan = (index, *self.plan_transition(path[index], path[index + 1]))
+            _, movers, direction, move_text = self.anim_plan
+            self.draw_scene_phase(phase, path[index], movers, direction, progress, move_text)
+            self.last_frame = frame
+        return index
+
+    def draw_background(self):
+        # Sky
+        self.canvas.create_rectangle(0, 0, 800, 300, fill=COLOR_SKY, outline="")
+        # River
+        self.canvas.create_rectangle(0, 300, 800, 600, fill=COLOR_RIVER, outline="")
+        # Left Bank
+        self.canvas.create_rectangle(0, 300, 250, 600, fill=COLOR_LAND, outline="")
+        # Right Bank
+        self.canvas.create_rectangle(550, 300, 800, 600, fill=COLOR_LAND, outline="")
+        
+        # Sun
+        self.canvas.create_oval(650, 50, 750, 150, fill="#FFD700", outline="#FFA500", width=2)
+        
+        # Clouds
+        self.draw_cloud(100, 80)
+        self.draw_cloud(250, 50)
+        self.draw_cloud(450, 90)
+        self.draw_cloud(50, 150)
+
+    def draw_cloud(self, x, y):
+        # Draw a fluffy cloud using overlapping ovals
+        self.canvas.create_oval(x, y, x+40, y+30, fill="white", outline="", tags="background")
+        self.canvas.create_oval(x+20, y-10, x+60, y+30, fill="white", outline="", tags="background")
+        self.canvas.create_oval(x+40, y, x+80, y+30, fill="white", outline="", tags="background")
+
+    def draw_entities(self, state):
+        # Static draw for start/end
+        # Use draw_scene_phase with empty movers to just draw the state static
+        # boat_pos 1=Left, 0=Right.
+        direction = "LtoR" if state[2] == 1 else "RtoL"
+        self.draw_scene_phase("cross", state, [], direction, 0.0)
+
+    def draw_character(self, x, y, char_type, color, tags="entity"):
+        if char_type == "M":
+            self.draw_missionary(x, y, tags)
+        else:
+            self.draw_cannibal(x, y, tags)
+
+    def draw_missionary(self, x, y, tags="entity"):
+        # Draw Missionary (Robe style)
+        # Head
+        self.canvas.create_oval(x-8, y-35, x+8, y-19, fill="#FFCCAA", outline="black", tags=tags) # Skin head
+        
+        # Body (Robe)
+        # Triangle/Trapezoid shape
+        points = [x, y-20, x-12, y+10, x+12, y+10]
+        self.canvas.create_polygon(points, fill=COLOR_MISSIONARY, outline="black", tags=tags)
+        
+        # Cross on chest
+        self.canvas.create_line(x, y-15, x, y, fill="black", width=1, tags=tags)
+        self.canvas.create_line(x-5, y-10, x+5, y-10, fill="black", width=1, tags=tags)
+
+    def draw_cannibal(self, x, y, tags="entity"):
+        # Draw Cannibal (Tribal style)
+        # Head
+        self.canvas.create_oval(x-8, y-35, x+8, y-19, fill="#D2691E", outline="black", tags=tags) # Darker skin head
+        
+        # Body (Torso)
+        self.canvas.create_oval(x-10, y-20, x+10, y+5, fill="#8B4513", outline="black", tags=tags) # Body
+        
+        # Skirt/Loincloth
+        skirt_points = [x-10, y, x+10, y, x+8, y+10, x-8, y+10]
+        self.canvas.create_polygon(skirt_points, fill=COLOR_CANNIBAL, outline="black", tags=tags)
+        
+        # Spear (held in hand)
+        self.canvas.create_line(x+10, y+10, x+15, y-25, fill="brown", width=2, tags=tags) # Shaft
+        self.canvas.create_polygon(x+14, y-25, x+16, y-25, x+15, y-30, fill="silver", outline="black", tags=tags) # Tip
+
+    def plan_transition(self, curr_state, next_state):
+        # Determine movement details
+        c_m, c_c, c_b = curr_state
+        n_m, n_c, n_b = next_state
+        
+        m_moved_count = abs(c_m - n_m)
+        c_moved_count = abs(c_c - n_c)
+        direction = "LtoR" if c_b == 1 else "RtoL"
+        
+        passengers = []
+        # Identify who moves (simplification: take from end of lists)
+        # We need (type, from_pos, to_pos)
+        
+        # Boat seats (indices)
+        # One seat per passenger; larger boats carry more than two
+        seat_indices = list(range(m_moved_count + c_moved_count))
+            
+        # Assign seats
+        seat_idx = 0
+        
+        # Source Bank Counts (for coordinate calculation)
+        if direction == "LtoR":
+            # Leaving Left Bank
+            # Missionaries taking last spots
+            src_m_start_idx = c_m - m_moved_count
+            src_c_start_idx = c_c - c_moved_count
+            bank_side = "left"
+        else:
+            # Leaving Right Bank
+            src_m_start_idx = (self.problem.n_missionaries - c_m) - m_moved_count # Right bank M count = M - c_m
+            src_c_start_idx = (self.problem.n_cannibals - c_c) - c_moved_count
+            bank_side = "right"
+
+        # Build movement list
+        # Each item: {"type": "M" or "C", "bank_idx": int, "seat_idx": int}
+        movers = []
+        
+        for i in range(m_moved_count):
+            movers.append({"type": "M", "bank_idx": src_m_start_idx + i, "seat_idx": seat_indices[seat_idx]})
+            seat_idx += 1
+            
+        for i in range(c_moved_count):
+            movers.append({"type": "C", "bank_idx": src_c_start_idx + i, "seat_idx": seat_indices[seat_idx]})
+            seat_idx += 1
+
+        # Move Description
+        parts = []
+        if m_moved_count > 0:
+            parts.append(f"{m_moved_count} Missionary" if m_moved_count == 1 else f"{m_moved_count} Missionaries")
+        if c_moved_count > 0:
+            parts.append(f"{c_moved_count} Cannibal" if c_moved_count == 1 else f"{c_moved_count} Cannibals")
+            
+        move_text_content = ", ".join(parts)
+        if direction == "LtoR":
+            move_text = f"{move_text_content} -> Right"
+        else:
+            move_text = f"Left <- {move_text_content}"
+
+        return movers, direction, move_text
+
+    def phase_at(self, offset):
+        """(phase, progress) at `offset` seconds into a move."""
+        if offset < EMBARK_SEC:
+            return "embark", offset / EMBARK_SEC
+        offset -= EMBARK_SEC
+        if offset < CROSS_SEC:
+            return "cross", offset / CROSS_SEC
+        offset -= CROSS_SEC
+        return "disembark", min(1.0, offset / DISEMBARK_SEC)
+
+    def clear_scene(self):
+        self.canvas.delete("entity")
+        self.sprite_positions = {}
+        self.move_text_id = None
+        self.anim_plan = None
+        self.last_frame = None
+
+    def place_sprite(self, tag, x, y, draw):
+        """
+        Put the canvas item group `tag` at (x, y): drawn on first use, then
+        only shifted with canvas.move, so frames allocate no new items.
+        """
+        old = self.sprite_positions.get(tag)
+        if old is None:
+            draw(x, y, ("entity", tag))
+        elif old != (x, y):
+            self.canvas.move(tag, x - old[0], y - old[1])
+        self.sprite_positions[tag] = (x, y)
+
+    def draw_scene_phase(self, phase, state, movers, direction, progress, move_text=""):
+        # Boat first, so every character is stacked above it
+        if not self.sprite_positions:
+            self.place_sprite("boat", 260, 500, self.draw_boat)
+
+        # Move Text in Sky
+        if self.move_text_id is None:
+            self.move_text_id = self.canvas.create_text(400, 280, text="", font=("Helvetica", 16, "bold"), fill="black", tags="entity")
+        self.canvas.itemconfig(self.move_text_id, text=move_text)
+        
+        m_left, c_left, boat_pos = state
+        
+        # Static counts (What remains on bank throughout)
+        # Assuming movers are "removed" from state for drawing
+        # If phase is embark, they are moving from bank to boat.
+        # So static = original - moving
+        
+        num_m_moving = len([x for x in movers if x["type"] == "M"])
+        num_c_moving = len([x for x in movers if x["type"] == "C"])
+        
+        # Calculate Static Entities on Banks
+        if direction == "LtoR":
+            static_m_l = m_left - num_m_moving
+            static_c_l = c_left - num_c_moving
+            static_m_r = self.problem.n_missionaries - m_left
+            static_c_r = self.problem.n_cannibals - c_left
+            boat_start_x = 260
+            boat_end_x = 540
+            bank_side = "left" # source
+        else:
+            # RtoL
+            static_m_l = m_left
+            static_c_l = c_left
+            static_m_r = (self.problem.n_missionaries - m_left) - num_m_moving # Right bank has total M - m_left.
+            static_c_r = (self.problem.n_cannibals - c_left) - num_c_moving
+            boat_start_x = 540
+            boat_end_x = 260
+            bank_side = "right" # source
+
+        # 1. Static Groups
+        positions = {
+            "M": self.bank_positions("left", "M", static_m_l) + self.bank_positions("right", "M", static_m_r),
+            "C": self.bank_positions("left", "C", static_c_l) + self.bank_positions("right", "C", static_c_r),
+        }
+        
+        # 2. Draw Boat
+        boat_y = 500
+        if phase == "embark":
+            boat_x = boat_start_x
+        elif phase == "disembark":
+            boat_x = boat_end_x
+        else: # cross
+            boat_x = boat_start_x + (boat_end_x - boat_start_x) * progress
+
+        self.place_sprite("boat", boat_x, boat_y, self.draw_boat)
+        
+        # 3. Movers
+        for mover in movers:
+            char_type = mover["type"]
+            bank_idx = mover["bank_idx"]
+            seat_idx = mover["seat_idx"]
+            
+            # Get Coordinates
+            # Boat Seat Coords (Relative to boat center)
+            offsets = [-20, 20, -45, 45]
+            offset = offsets[seat_idx] if seat_idx < len(offsets) else 0
+            seat_x = boat_x + offset
+            seat_y = boat_y - 20
+            
+            # Bank Coords
+            bx, by = self.get_bank_coords(bank_side if phase != "disembark" else ("right" if bank_side=="left" else "left"), 
+                                          char_type, bank_idx)
+            
+            # If Disembarking, destination is opposite bank
+            # Logic check:
+            # Embark: Source Bank -> Boat (Boat Static)
+            # Cross: Boat -> Boat (Passenger Fixed on Boat)
+            # Disembark: Boat -> Dest Bank (Boat Static)
+            
+            draw_x, draw_y = 0, 0
+            
+            if phase == "embark":
+                # Interp Bank -> Seat
+                bx, by = self.get_bank_coords(bank_side, char_type, bank_idx)
+                
+                # Ease out
+                t = progress
+                draw_x = bx + (seat_x - bx) * t
+                draw_y = by + (seat_y - by) * t
+                
+            elif phase == "cross":
+                # Fixed values on boat
+                draw_x = seat_x
+                draw_y = seat_y
+                
+            elif phase == "disembark":
+                # Interp Left Seat -> Right Bank
+                dest_side = "right" if direction == "LtoR" else "left"
+                
+                # We need destination index.
+                # If LtoR, moving to Right Bank. existing right bank has static_m_r.
+                # So new items append after static_m_r.
+                # Actually, simplistic view: just append to end of existing list on dest.
+                
+                # We need to map *which* mover goes to *which* dest index.
+                # Simple stack: if type M, index = static_m_dest + (0, 1..)
+                # But we are iterating movers. We need to know order.
+                # Let's recalculate dest index on fly or precalc.
+                
+                # Hacky: Assume calculate dest_idx based on current static + order in movers
+                # But movers mixed M/C.
+                # Let's count seen Ms and Cs in this loop? No, that resets every frame.
+                # Use mover list index?
+                pass
+                
+                # Better: calculate dest_idx dynamically
+                if char_type == "M":
+                    # How many Ms before me in movers?
+                    my_m_order = len([m for m in movers[:movers.index(mover)] if m["type"]=="M"])
+                    
+                    if dest_side == "right": dest_start = static_m_r
+                    else: dest_start = static_m_l
+                    
+                    dest_idx = dest_start + my_m_order
+                else:
+                    my_c_order = len([m for m in movers[:movers.index(mover)] if m["type"]=="C"])
+                    if dest_side == "right": dest_start = static_c_r
+                    else: dest_start = static_c_l
+                    dest_idx = dest_start + my_c_order
+                
+                bx, by = self.get_bank_coords(dest_side, char_type, dest_idx)
+                
+                t = progress
+                draw_x = seat_x + (bx - seat_x) * t
+                draw_y = seat_y + (by - seat_y) * t
+            
+            positions[char_type].append((draw_x, draw_y))
+
+        # 4. Place characters; they all look alike, so any sprite can take any slot
+        for char_type, color in (("M", COLOR_MISSIONARY), ("C", COLOR_CANNIBAL)):
+            for i, (x, y) in enumerate(positions[char_type]):
+                self.place_sprite(f"{char_type}{i}", x, y,
+                                  lambda x, y, tags, t=char_type, c=color: self.draw_character(x, y, t, c, tags))
+
+    def get_bank_coords(self, side, char_type, index):
+        # 100, 350
+        if side == "left":
+            base_x = 100
+        else:
+            base_x = 700
+            
+        spacing = 30
+        
+        # M: start_y = 350
+        # C: start_y = 450
+        
+        start_y = 350 if char_type == "M" else 450
+        
+        x = base_x - 50 + (index % 3) * spacing
+        y = start_y + (index // 3) * 60
+        
+        return x, y
+
+    def draw_boat(self, x, y, tags="entity"):
+        # Draw realistic boat (Wooden Trapezoid)
+        # Hull
+        hull_points = [x-60, y-10, x+60, y-10, x+40, y+20, x-40, y+20]
+        self.canvas.create_polygon(hull_points, fill=COLOR_BOAT, outline="black", width=2, tags=tags)
+        
+        # Wood planks details
+        self.canvas.create_line(x-55, y, x+55, y, fill="#5C3317", width=1, tags=tags)
+        self.canvas.create_line(x-48, y+10, x+48, y+10, fill="#5C3317", width=1, tags=tags)
+        
+        # Label
+        self.canvas.create_text(x, y+5, text="BOAT", fill="white", font=("Arial", 8, "bold"), tags=tags)
+
+    def bank_positions(self, side, char_type, count):
+        return [self.get_bank_coords(side, char_type, i) for i in range(count)]
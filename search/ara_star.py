@@ -0,0 +1,180 @@
+"""
+Anytime Repairing A* (ARA*) for the River Crossing Problem.
+
+ARA* (Likhachev, Gordon & Thrun, 2003) runs Weighted A* with a high weight
+to find a first solution quickly, then repeatedly lowers the weight and
+repairs the search, reusing the g-values found so far instead of starting
+over. Every pass can only improve the solution, and each one comes with a
+suboptimality bound; once the weight reaches 1 the solution is optimal.
+
+States whose g-value improves after they were expanded in the current pass
+are parked in an INCONS list rather than re-expanded, and are put back on
+the open list when the weight drops.
+
+`solutions` yields every improved solution as it is found. `solve` returns
+the best one found within `time_limit` seconds (or the optimal one without a
+limit); when the limit passes it returns the current best path.
+"""
+
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+import heapq
+import math
+import time
+
+from core.river_crossing import DEFAULT_PROBLEM, Problem, State
+from core.events import Expansion
+from core.heuristics import get_heuristic
+from core.index import get_index
+from core.paths import reconstruct
+
+DEFAULT_WEIGHT = 5.0
+DEFAULT_WEIGHT_STEP = 1.0
+
+
+class Solution(NamedTuple):
+    """An improved solution published by ARA*."""
+
+    path: List[State]
+    bound: float          # path length is at most bound x optimal
+    nodes_explored: int   # expansions so far, over all passes
+    time_ms: float        # since the search started
+
+
+def solve(problem: Optional[Problem] = None,
+          weight: float = DEFAULT_WEIGHT,
+          weight_step: float = DEFAULT_WEIGHT_STEP,
+          heuristic: str = "simple",
+          time_limit: Optional[float] = None) -> Tuple[List[State], int, float]:
+    """
+    Solve the Missionaries and Cannibals problem using ARA*.
+
+    Args:
+        problem: Instance to solve (defaults to the classic 3/3/2 instance).
+        weight: Initial heuristic weight (>= 1).
+        weight_step: Amount the weight drops between passes.
+        heuristic: Name of the heuristic to use (see core.heuristics.HEURISTICS).
+        time_limit: Optional limit in seconds; the best path so far is returned.
+
+    Returns:
+        tuple: (path, nodes_explored, time_ms)
+    """
+    start_time = time.perf_counter()
+    path, nodes_explored = [], 0
+    for event in _search(problem, weight, weight_step, heuristic, time_limit):
+        if isinstance(event, Solution):
+            path = event.path
+        else:
+            nodes_explored += 1
+    elapsed_ms = (time.perf_counter() - start_time) * 1000.0
+    return path, nodes_explored, elapsed_ms
+
+
+def solutions(problem: Optional[Problem] = None,
+              weight: float = DEFAULT_WEIGHT,
+              weight_step: float = DEFAULT_WEIGHT_STEP,
+              heuristic: str = "simple",
+              time_limit: Optional[float] = None) -> Iterator[Solution]:
+    """Yield each improved Solution as soon as it is found."""
+    for event in _search(problem, weight, weight_step, heuristic, time_limit):
+        if isinstance(event, Solution):
+            yield event
+
+
+def search_iter(problem: Optional[Problem] = None,
+                weight: float = DEFAULT_WEIGHT,
+                weight_step: float = DEFAULT_WEIGHT_STEP,
+                heuristic: str = "simple",
+                time_limit: Optional[float] = None) -> Iterator[Expansion]:
+    """
+    ARA* that yields an Expansion for every expansion of every pass and
+    returns the best solution path (or []) when it stops.
+    """
+    path = []
+    for event in _search(problem, weight, weight_step, heuristic, time_limit):
+        if isinstance(event, Solution):
+            path = event.path
+        else:
+            yield event
+    return path
+
+
+def _search(problem: Optional[Problem], weight: float, weight_step: float,
+            heuristic: str, time_limit: Optional[float]) -> Iterator[Union[Expansion, Solution]]:
+    if weight < 1:
+        raise ValueError("weight must be at least 1")
+    if weight_step <= 0:
+        raise ValueError("weight_step must be positive")
+    problem = problem or DEFAULT_PROBLEM
+    h = get_heuristic(problem, heuristic)
+    index = get_index(problem)
+    start_time = time.perf_counter()
+    deadline = None if time_limit is None else start_time + time_limit
+
+    start = problem.initial_state
+    goal = problem.goal_state
+    came_from: Dict[State, Optional[State]] = {start: None}
+    g_score: Dict[State, int] = {start: 0}
+    # OPEN is the set of keys; the heap may hold stale entries for them
+    open_set: Set[State] = {start}
+    open_heap: List[Tuple[float, float, State]] = []
+    incons: Set[State] = set()
+    best_length = math.inf
+    nodes_explored = 0
+
+    def key(state: State) -> Tuple[float, float, State]:
+        h_state = h(state)
+        return g_score[state] + weight * h_state, h_state, state
+
+    while True:
+        # Start a pass: OPEN absorbs INCONS and is re-keyed for the new weight
+        open_set |= incons
+        incons = set()
+        open_heap = [key(state) for state in open_set]
+        heapq.heapify(open_heap)
+        closed: Set[State] = set()
+
+        # ImprovePath: expand until the goal's g is no worse than the best key
+        while open_heap and g_score.get(goal, math.inf) > open_heap[0][0]:
+            if deadline is not None and time.perf_counter() > deadline:
+                return
+
+            f, _, current = heapq.heappop(open_heap)
+            if current not in open_set or f != key(current)[0]:
+                continue  # Stale entry
+            open_set.remove(current)
+            closed.add(current)
+            nodes_explored += 1
+            yield Expansion(current, g_score[current], len(open_set))
+
+            tentative_g = g_score[current] + 1
+            for neighbor in index.successors(current):
+                if neighbor in g_score and tentative_g >= g_score[neighbor]:
+                    continue
+                h_neighbor = h(neighbor)
+                if h_neighbor == math.inf:
+                    continue
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                if neighbor in closed:
+                    incons.add(neighbor)
+                else:
+                    open_set.add(neighbor)
+                    heapq.heappush(open_heap, (tentative_g + weight * h_neighbor, h_neighbor, neighbor))
+
+        goal_g = g_score.get(goal, math.inf)
+        if goal_g == math.inf:
+            return  # OPEN ran dry: no solution
+
+        # Suboptimality bound: goal g over the least g + h still pending
+        pending = [g_score[state] + h(state) for state in open_set | incons]
+        lower = min(pending) if pending else goal_g
+        bound = min(weight, goal_g / lower) if lower > 0 else 1.0
+
+        if goal_g < best_length:
+            best_length = goal_g
+            yield Solution(reconstruct(came_from, goal), max(bound, 1.0), nodes_explored,
+                           (time.perf_counter() - start_time) * 1000.0)
+
+        if bound <= 1 or weight == 1:
+            return
+        weight = max(1.0, weight - weight_step)
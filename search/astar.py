@@ -1,49 +1,167 @@
-from typing import List, Tuple, Optional, Dict
+from typing import Dict, Iterator, List, Optional, Tuple
 import heapq
+import math
 import time
 from core.river_crossing import *
+from core.events import Expansion, run_events
+from core.heuristics import get_heuristic
+from core.frontier import BucketQueue, check_frontier, integer_key
+from core.index import get_index
+from core.packed import new_visited, new_int_table, reconstruct_path
+from core.paths import reconstruct
 
 
-def solve() -> Tuple[int, List[Tuple[int, int, int]], float]:
+def solve(problem: Optional[Problem] = None,
+          packed: bool = False,
+          heuristic: str = "simple",
+          frontier: str = "heap") -> Tuple[List[Tuple[int, int, int]], int, float]:
+    problem = problem or DEFAULT_PROBLEM
+    check_frontier(frontier)
+    if frontier == "bucket":
+        if packed:
+            raise ValueError("the bucket frontier has no packed variant")
+        return _solve_bucket(problem, heuristic)
+    if packed:
+        return _solve_packed(problem, heuristic)
+
     start_time = time.perf_counter()
-    open_heap: List[Tuple[float, Tuple[int, int, int]]] = []
-    came_from: Dict[Tuple[int, int, int], Optional[Tuple[int, int, int]]] = {INITIAL_STATE: None}
-    g_score: Dict[Tuple[int, int, int], float] = {INITIAL_STATE: 0.0}
-    visited: set[Tuple[int, int, int]] = set()
+    # Building the heuristic (e.g. the pattern database) is part of the solve
+    path, nodes_explored = run_events(search_iter(problem, heuristic))
+    elapsed_ms = (time.perf_counter() - start_time) * 1000.0
+    return path, nodes_explored, elapsed_ms
 
-    heapq.heappush(open_heap, (heuristic(INITIAL_STATE), INITIAL_STATE))
 
-    nodes_explored = 0
+def search_iter(problem: Optional[Problem] = None,
+                heuristic: str = "simple") -> Iterator[Expansion]:
+    """
+    A* that yields an Expansion for every closed state (depth = g) and
+    returns the solution path (or []) when it stops.
+    """
+    problem = problem or DEFAULT_PROBLEM
+    h = get_heuristic(problem, heuristic)
+    index = get_index(problem)
+
+    start = problem.initial_state
+    # Entries are (f, h, state): among equal f, states closer to the goal win
+    open_heap: List[Tuple[float, float, Tuple[int, int, int]]] = [(h(start), h(start), start)]
+    came_from: Dict[Tuple[int, int, int], Optional[Tuple[int, int, int]]] = {start: None}
+    g_score: Dict[Tuple[int, int, int], int] = {start: 0}
+    visited: set[Tuple[int, int, int]] = set()
 
     while open_heap:
-        _, current = heapq.heappop(open_heap)
+        _, _, current = heapq.heappop(open_heap)
         if current in visited:
             continue
         visited.add(current)
+        yield Expansion(current, g_score[current], len(open_heap))
+
+        if problem.is_goal(current):
+            return reconstruct(came_from, current)
+
+        tentative_g = g_score[current] + 1
+        for neighbor in index.successors(current):
+            if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                h_neighbor = h(neighbor)
+                if h_neighbor == math.inf:
+                    continue  # Heuristic proves the goal unreachable from here
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                heapq.heappush(open_heap, (tentative_g + h_neighbor, h_neighbor, neighbor))
+
+    return []
+
+
+def _solve_bucket(problem: Problem, heuristic: str) -> Tuple[List[Tuple[int, int, int]], int, float]:
+    """
+    A* over a BucketQueue keyed by f = (g + h) * capacity, ties to the
+    larger g. Improving a queued state moves it (decrease-key), so every
+    state is queued at most once.
+    """
+    start = problem.initial_state
+    start_time = time.perf_counter()
+    h = get_heuristic(problem, heuristic)
+    index = get_index(problem)
+    open_queue = BucketQueue()
+    came_from: Dict[Tuple[int, int, int], Optional[Tuple[int, int, int]]] = {start: None}
+    g_score: Dict[Tuple[int, int, int], int] = {start: 0}
+    closed: set[Tuple[int, int, int]] = set()
+
+    scale = problem.boat_capacity
+    h_start = h(start)
+    if h_start != math.inf:
+        open_queue.push(start, integer_key(h_start, scale), 0)
+
+    nodes_explored = 0
+
+    while open_queue:
+        current, _, g = open_queue.pop()
+        closed.add(current)
         nodes_explored += 1
 
-        if is_goal(current):
-            path = _reconstruct(came_from, current)
+        if problem.is_goal(current):
+            path = reconstruct(came_from, current)
             elapsed_ms = (time.perf_counter() - start_time) * 1000.0
             return path, nodes_explored, elapsed_ms
 
-        for neighbor in get_successors(current):
-            tentative_g = g_score[current] + 1.0
+        tentative_g = g + 1
+        for neighbor in index.successors(current):
+            if neighbor in closed:
+                continue  # Consistent heuristic: closed states are final
             if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                h_neighbor = h(neighbor)
+                if h_neighbor == math.inf:
+                    continue
                 came_from[neighbor] = current
                 g_score[neighbor] = tentative_g
-                f = tentative_g + heuristic(neighbor)
-                heapq.heappush(open_heap, (f, neighbor))
+                open_queue.push(neighbor, tentative_g * scale + integer_key(h_neighbor, scale), tentative_g)
 
     elapsed_ms = (time.perf_counter() - start_time) * 1000.0
     return [], nodes_explored, elapsed_ms
 
 
-def _reconstruct(came_from: Dict[Tuple[int, int, int], Optional[Tuple[int, int, int]]],
-                 current: Tuple[int, int, int]) -> List[Tuple[int, int, int]]:
-    path: List[Tuple[int, int, int]] = [current]
-    while came_from[current] is not None:
-        current = came_from[current]  # type: ignore
-        path.append(current)
-    path.reverse()
-    return path
\ No newline at end of file
+def _solve_packed(problem: Problem, heuristic: str) -> Tuple[List[Tuple[int, int, int]], int, float]:
+    """
+    A* over packed integer states: the closed set is a bytearray and
+    parents / g-scores are array('i') tables indexed by the packed state.
+    """
+    start_time = time.perf_counter()
+    h = get_heuristic(problem, heuristic)
+    index = get_index(problem)
+    start_idx = problem.encode(problem.initial_state)
+    goal_idx = problem.encode(problem.goal_state)
+
+    visited = new_visited(problem)
+    parents = new_int_table(problem)
+    g_score = new_int_table(problem)
+    g_score[start_idx] = 0
+
+    open_heap: List[Tuple[float, float, int]] = []
+    h_start = h(problem.initial_state)
+    heapq.heappush(open_heap, (h_start, h_start, start_idx))
+
+    nodes_explored = 0
+
+    while open_heap:
+        _, _, current = heapq.heappop(open_heap)
+        if visited[current]:
+            continue
+        visited[current] = 1
+        nodes_explored += 1
+
+        if current == goal_idx:
+            path = reconstruct_path(problem, parents, current)
+            elapsed_ms = (time.perf_counter() - start_time) * 1000.0
+            return path, nodes_explored, elapsed_ms
+
+        tentative_g = g_score[current] + 1
+        for neighbor in index.successor_indices(current):
+            if g_score[neighbor] < 0 or tentative_g < g_score[neighbor]:
+                h_neighbor = h(problem.decode(neighbor))
+                if h_neighbor == math.inf:
+                    continue
+                parents[neighbor] = current
+                g_score[neighbor] = tentative_g
+                heapq.heappush(open_heap, (tentative_g + h_neighbor, h_neighbor, neighbor))
+
+    elapsed_ms = (time.perf_counter() - start_time) * 1000.0
+    return [], nodes_explored, elapsed_ms
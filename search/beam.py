@@ -0,0 +1,98 @@
+"""
+Beam search for the River Crossing Problem.
+
+A breadth-first search that keeps only the `width` most promising states
+(lowest heuristic value) of each layer. Memory and time per layer are
+bounded by the width, so it answers quickly on huge instances, but it is
+neither complete nor optimal: a narrow beam can prune every route to the
+goal. Widen the beam to trade latency for solution quality.
+
+Use `time_limit` to cap the search in seconds; when it passes before a
+solution is found the solver returns an empty path.
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+import heapq
+import math
+import time
+
+from core.river_crossing import DEFAULT_PROBLEM, Problem, State
+from core.events import Expansion, run_events
+from core.heuristics import get_heuristic
+from core.index import get_index
+from core.paths import reconstruct
+
+DEFAULT_WIDTH = 100
+
+
+def solve(problem: Optional[Problem] = None,
+          width: int = DEFAULT_WIDTH,
+          heuristic: str = "simple",
+          time_limit: Optional[float] = None) -> Tuple[List[State], int, float]:
+    """
+    Solve the Missionaries and Cannibals problem using beam search.
+
+    Args:
+        problem: Instance to solve (defaults to the classic 3/3/2 instance).
+        width: States kept per layer.
+        heuristic: Name of the heuristic to use (see core.heuristics.HEURISTICS).
+        time_limit: Optional limit in seconds.
+
+    Returns:
+        tuple: (path, nodes_explored, time_ms)
+    """
+    start_time = time.perf_counter()
+    path, nodes_explored = run_events(search_iter(problem, width, heuristic, time_limit))
+    elapsed_ms = (time.perf_counter() - start_time) * 1000.0
+    return path, nodes_explored, elapsed_ms
+
+
+def search_iter(problem: Optional[Problem] = None,
+                width: int = DEFAULT_WIDTH,
+                heuristic: str = "simple",
+                time_limit: Optional[float] = None) -> Iterator[Expansion]:
+    """
+    Beam search that yields an Expansion for every expanded state (depth is
+    the layer) and returns the solution path (or []) when it stops.
+    """
+    if width < 1:
+        raise ValueError("width must be at least 1")
+    problem = problem or DEFAULT_PROBLEM
+    h = get_heuristic(problem, heuristic)
+    index = get_index(problem)
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+
+    start = problem.initial_state
+    # Parent pointers of every state that made it into a beam
+    came_from: Dict[State, Optional[State]] = {start: None}
+    layer = [start]
+    depth = 0
+
+    while layer:
+        # Best (h, parent) per candidate of the next layer
+        candidates: Dict[State, Tuple[float, State]] = {}
+
+        for i, current in enumerate(layer):
+            if deadline is not None and time.perf_counter() > deadline:
+                return []
+            yield Expansion(current, depth, len(layer) - i - 1)
+
+            if problem.is_goal(current):
+                return reconstruct(came_from, current)
+
+            for neighbor in index.successors(current):
+                if neighbor in came_from or neighbor in candidates:
+                    continue
+                h_neighbor = h(neighbor)
+                if h_neighbor == math.inf:
+                    continue
+                candidates[neighbor] = (h_neighbor, current)
+
+        best = heapq.nsmallest(width, candidates.items(), key=lambda item: (item[1][0], item[0]))
+        layer = []
+        for state, (_, parent) in best:
+            came_from[state] = parent
+            layer.append(state)
+        depth += 1
+
+    return []
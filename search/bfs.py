@@ -1,73 +1,153 @@
 from core.river_crossing import *
+from core.events import Expansion, run_events
+from core.index import get_index
+from core.paths import reconstruct
+from core.packed import new_visited, new_int_table, reconstruct_path
 from collections import deque
 import time
 
 
-def solve():
-    start_time = time.time()
+def solve(problem=None, packed=False, vectorized=False):
+    problem = problem or DEFAULT_PROBLEM
+    if vectorized:
+        return _solve_vectorized(problem)
+    if packed:
+        return _solve_packed(problem)
 
-    states_to_explore = deque([INITIAL_STATE])
+    start_time = time.perf_counter()
+    solution_path, nodes_explored = run_events(search_iter(problem))
+    execution_time = (time.perf_counter() - start_time) * 1000
+    return solution_path, nodes_explored, execution_time
+
+
+def search_iter(problem=None):
+    """
+    BFS that yields an Expansion for every dequeued state and returns the
+    solution path (or []) when it stops.
+    """
+    problem = problem or DEFAULT_PROBLEM
+    index = get_index(problem)
+
+    states_to_explore = deque([problem.initial_state])
+    came_from = {problem.initial_state: None}
+    depth = {problem.initial_state: 0}
+
+    while states_to_explore:
+        current_state = states_to_explore.popleft()
+        yield Expansion(current_state, depth[current_state], len(states_to_explore))
+
+        if problem.is_goal(current_state):
+            return reconstruct(came_from, current_state)
+
+        for next_state in index.successors(current_state):
+            if next_state not in came_from:
+                came_from[next_state] = current_state
+                depth[next_state] = depth[current_state] + 1
+                states_to_explore.append(next_state)
+
+    return []
+
+
+def _solve_packed(problem):
+    """
+    BFS over packed integer states: visited flags live in a bytearray and
+    parent pointers in an array('i'), so no tuples are hashed or stored.
+    """
+    start_time = time.perf_counter()
+    index = get_index(problem)
 
-    explored_states = set([INITIAL_STATE])
+    start_idx = problem.encode(problem.initial_state)
+    goal_idx = problem.encode(problem.goal_state)
 
-    came_from = {INITIAL_STATE: None}
+    visited = new_visited(problem)
+    parents = new_int_table(problem)
+    visited[start_idx] = 1
+
+    states_to_explore = deque([start_idx])
 
     nodes_explored = 0
 
-    goal_found = None
+    goal_found = False
 
     while states_to_explore:
-        current_state = states_to_explore.popleft()
+        current_idx = states_to_explore.popleft()
         nodes_explored += 1
 
-        if is_goal(current_state):
-            goal_found = current_state
+        if current_idx == goal_idx:
+            goal_found = True
             break
 
-        for next_state in get_successors(current_state):
-            if next_state not in explored_states:
-                explored_states.add(next_state)
-                states_to_explore.append(next_state)
-
-                move_taken = _calculate_move(current_state, next_state)
-                came_from[next_state] = (current_state, move_taken)
+        for next_idx in index.successor_indices(current_idx):
+            if not visited[next_idx]:
+                visited[next_idx] = 1
+                parents[next_idx] = current_idx
+                states_to_explore.append(next_idx)
 
-    execution_time = (time.time() - start_time) * 1000
+    execution_time = (time.perf_counter() - start_time) * 1000
 
-    if goal_found is None:
+    if not goal_found:
         return [], nodes_explored, execution_time
 
-    solution_path = _reconstruct_path(came_from, goal_found)
+    return reconstruct_path(problem, parents, goal_idx), nodes_explored, execution_time
 
-    return solution_path, nodes_explored, execution_time
 
+def _solve_vectorized(problem):
+    """
+    Level-synchronous BFS: each whole level is expanded in one NumPy batch
+    via core.vectorized.expand_frontier. Successors keep queue order, so the
+    path and node count match the one-state-at-a-time BFS.
+    """
+    import numpy as np
+    from core.vectorized import move_matrix, encode_states, decode_states, expand_frontier
+
+    start_time = time.perf_counter()
+    moves = move_matrix(problem)
 
-def _calculate_move(start_state, end_state):
-    missionaries_start, cannibals_start, boat_start = start_state
-    missionaries_end, cannibals_end, boat_end = end_state
+    start_idx = problem.encode(problem.initial_state)
+    goal_idx = problem.encode(problem.goal_state)
 
-    if boat_start == 1 and boat_end == 0:
-        missionaries_moved = missionaries_start - missionaries_end
-        cannibals_moved = cannibals_start - cannibals_end
+    visited = np.zeros(problem.num_states, dtype=bool)
+    parents = np.full(problem.num_states, -1, dtype=np.int32)
+    visited[start_idx] = True
 
-    elif boat_start == 0 and boat_end == 1:
-        missionaries_moved = missionaries_end - missionaries_start
-        cannibals_moved = cannibals_end - cannibals_start
+    frontier = np.array([start_idx], dtype=np.int64)
 
-    else:
-        raise ValueError(f"Invalid boat movement: {start_state} -> {end_state}")
+    nodes_explored = 0
+
+    goal_found = start_idx == goal_idx
+    if goal_found or not problem.is_valid_state(problem.initial_state):
+        # Nothing to expand: either solved already or an unsafe start
+        nodes_explored = 1
+        frontier = frontier[:0]
+
+    while not goal_found and len(frontier):
+        successors, sources = expand_frontier(problem, decode_states(problem, frontier), moves)
+        next_idx = encode_states(problem, successors)
 
-    return (missionaries_moved, cannibals_moved)
+        fresh = ~visited[next_idx]
+        next_idx = next_idx[fresh]
+        sources = sources[fresh]
 
+        # Keep only the first discovery of each state, in discovery order
+        _, first = np.unique(next_idx, return_index=True)
+        first.sort()
+        next_idx = next_idx[first]
 
-def _reconstruct_path(came_from, goal_state):
-    path = [goal_state]
-    current_state = goal_state
+        visited[next_idx] = True
+        parents[next_idx] = frontier[sources[first]]
 
-    while came_from[current_state] is not None:
-        previous_state, move_taken = came_from[current_state]
-        path.append(previous_state)
-        current_state = previous_state
+        hits = np.flatnonzero(next_idx == goal_idx)
+        if len(hits):
+            # Sequential BFS would expand this level, then pop up to the goal
+            nodes_explored += len(frontier) + int(hits[0]) + 1
+            goal_found = True
+        else:
+            nodes_explored += len(frontier)
+            frontier = next_idx
+
+    execution_time = (time.perf_counter() - start_time) * 1000
+
+    if not goal_found:
+        return [], nodes_explored, execution_time
 
-    path.reverse()
-    return path
+    return reconstruct_path(problem, parents, goal_idx), nodes_explored, execution_time
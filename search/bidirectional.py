@@ -0,0 +1,134 @@
+"""
+Bidirectional Breadth-First Search for the River Crossing Problem.
+
+Every boat trip can be undone by carrying the same people back, so the
+transition relation is symmetric and the successors of a state are also its
+predecessors. The search therefore grows one BFS tree forward from the
+initial state and one backward from the goal state, always expanding a full
+level of the smaller frontier, and stops once the two trees meet.
+"""
+
+from core.river_crossing import *
+from core.events import Expansion, run_events
+from core.index import get_index
+import time
+
+
+def solve(problem=None):
+    """
+    Solve the Missionaries and Cannibals problem with bidirectional BFS.
+
+    Args:
+        problem: Problem instance to solve (defaults to the classic 3/3/2 instance)
+
+    Returns:
+        tuple: (solution_path, nodes_explored, execution_time)
+            - solution_path: shortest list of states from initial to goal
+            - nodes_explored: number of states expanded by both searches
+            - execution_time: wall-clock time in milliseconds
+    """
+    start_time = time.perf_counter()
+    solution_path, nodes_explored = run_events(search_iter(problem))
+    execution_time = (time.perf_counter() - start_time) * 1000
+    return solution_path, nodes_explored, execution_time
+
+
+def search_iter(problem=None):
+    """
+    Bidirectional BFS that yields an Expansion for every expanded state of
+    either search (depth is measured from that search's root, frontier_size
+    counts both frontiers) and returns the solution path (or []) when it
+    stops.
+    """
+    problem = problem or DEFAULT_PROBLEM
+    index = get_index(problem)
+
+    start, goal = problem.initial_state, problem.goal_state
+
+    if start == goal:
+        yield Expansion(start, 0, 0)
+        return [start]
+
+    # Per direction: parent pointers (toward its root) and BFS depth
+    forward = ({start: None}, {start: 0})
+    backward = ({goal: None}, {goal: 0})
+
+    forward_frontier = [start]
+    backward_frontier = [goal]
+
+    meeting = None
+
+    while forward_frontier and backward_frontier and meeting is None:
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meeting = yield from _iter_level(
+                index, forward_frontier, forward, backward, len(backward_frontier))
+        else:
+            backward_frontier, meeting = yield from _iter_level(
+                index, backward_frontier, backward, forward, len(forward_frontier))
+
+    if meeting is None:
+        return []
+
+    return _reconstruct_path(forward[0], backward[0], meeting)
+
+
+def _iter_level(index, frontier, own, other, other_size):
+    """
+    Expand one complete BFS level of one direction, yielding an Expansion
+    per state.
+
+    The whole level is expanded before returning, and the meeting state with
+    the smallest combined depth is kept, which makes the joined path a
+    shortest one.
+
+    Returns:
+        tuple: (next_frontier, meeting_state or None)
+    """
+    own_parents, own_depth = own
+    _, other_depth = other
+
+    next_frontier = []
+    meeting = None
+    best_length = None
+
+    for position, state in enumerate(frontier):
+        pending = len(frontier) - position - 1 + len(next_frontier) + other_size
+        yield Expansion(state, own_depth[state], pending)
+
+        depth = own_depth[state] + 1
+        for next_state in index.successors(state):
+            if next_state not in own_parents:
+                own_parents[next_state] = state
+                own_depth[next_state] = depth
+                next_frontier.append(next_state)
+
+            if next_state in other_depth:
+                length = own_depth[next_state] + other_depth[next_state]
+                if best_length is None or length < best_length:
+                    best_length = length
+                    meeting = next_state
+
+    return next_frontier, meeting
+
+
+def _reconstruct_path(forward_parents, backward_parents, meeting):
+    """
+    Join the forward chain (initial → meeting) with the backward chain
+    (meeting → goal).
+
+    Returns:
+        list: [state1, state2, ...]
+    """
+    path = []
+    current = meeting
+    while current is not None:
+        path.append(current)
+        current = forward_parents[current]
+    path.reverse()
+
+    current = backward_parents[meeting]
+    while current is not None:
+        path.append(current)
+        current = backward_parents[current]
+
+    return path
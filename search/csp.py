@@ -4,95 +4,122 @@ Constraint Satisfaction Problem (CSP) solver for the River Crossing Problem.
 CSP Formulation:
 - Variables: Each step i in the solution path represents a state
 - Domain: For each state, the domain is all valid successor states
-- Constraints: 
+- Constraints:
   1. State validity (no missionaries eaten)
   2. No cycles (no repeated states in the path)
-  
-Uses backtracking with forward checking to find a solution.
+
+Uses backtracking with forward checking to find a solution. The backtracking
+runs on an explicit stack of domain iterators, so deep instances never touch
+the recursion limit, and the path is assembled in place (one append per
+assignment, one pop per backtrack).
+
+Once every value below an assignment has failed, the state is kept as a
+nogood: it is never assigned again. Revisiting it could only explore states
+already known not to lead to the goal, so the search stays complete and
+each state is assigned at most once.
 """
 
+from typing import Iterator, List, Optional, Set
+
 from core.river_crossing import *
+from core.events import Expansion, run_events
+from core.index import TransitionIndex, get_index
 import time
 
 
-def solve():
+def solve(problem=None, forward_checking=True, mrv=False):
     """
     Solve the Missionaries and Cannibals problem using CSP with backtracking.
-    
+
+    Args:
+        problem: Problem instance to solve (defaults to the classic 3/3/2 instance)
+        forward_checking: Prune values whose own domain is already empty
+        mrv: Try values with the fewest remaining values first (minimum
+            remaining values). Off by default: on this graph it steers the
+            search into long detours.
+
     Returns:
         tuple: (solution_path, nodes_explored, execution_time)
             - solution_path: list of states from initial to goal
             - nodes_explored: number of state assignments attempted
             - execution_time: wall-clock time in milliseconds
     """
-    start_time = time.time()
-    
-    # Track visited states to avoid cycles (constraint)
-    visited = set([INITIAL_STATE])
-    
-    # Start backtracking search from initial state
-    solution_path, nodes_explored = _backtrack(INITIAL_STATE, visited, 0)
-    
-    execution_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-    
-    if solution_path is None:
-        return [], nodes_explored, execution_time
-    
+    start_time = time.perf_counter()
+    solution_path, nodes_explored = run_events(search_iter(problem, forward_checking, mrv))
+    execution_time = (time.perf_counter() - start_time) * 1000  # Convert to milliseconds
     return solution_path, nodes_explored, execution_time
 
 
-def _backtrack(current_state, visited, nodes_explored):
+def search_iter(problem=None, forward_checking=True, mrv=False) -> Iterator[Expansion]:
     """
-    Recursive backtracking function to find a solution.
-    
-    Args:
-        current_state: Current state in the search
-        visited: Set of visited states (to avoid cycles)
-        nodes_explored: Counter for nodes explored
-    
-    Returns:
-        Tuple of (path, nodes_count) where path is list of states or None, 
-        and nodes_count is the number of nodes explored
+    Backtracking search that yields an Expansion for every state assignment
+    (frontier_size is the number of open decision levels) and returns the
+    solution path (or []) when it stops.
     """
-    # Increment node counter
-    nodes_explored += 1
-    
-    # Goal test
-    if is_goal(current_state):
-        return [current_state], nodes_explored
-    
-    M_L, C_L, boat = current_state
-    
-    # Generate all valid successors manually (domain for this variable)
-    # Instead of using get_successors, we iterate through MOVES directly
-    for m_move, c_move in MOVES:
-        # Calculate new state based on boat position
-        if boat == 1:  # Boat on left → moving to right
-            new_M_L = M_L - m_move
-            new_C_L = C_L - c_move
-            new_boat = 0
-        else:  # Boat on right → moving to left
-            new_M_L = M_L + m_move
-            new_C_L = C_L + c_move
-            new_boat = 1
-
-        next_state = (new_M_L, new_C_L, new_boat)
-        
-        # Check if state is valid and not visited (constraints)
-        if is_valid_state(next_state) and next_state not in visited:
-            # Make assignment
-            visited.add(next_state)
-            
-            # Recursively solve from next_state
-            result_path, nodes_explored = _backtrack(next_state, visited, nodes_explored)
-            
-            # If solution found, build path
-            if result_path is not None:
-                return [current_state] + result_path, nodes_explored
-            
-            # Backtrack: undo assignment
-            visited.remove(next_state)
-    
-    # No solution found from this state
-    return None, nodes_explored
+    problem = problem or DEFAULT_PROBLEM
+    index = get_index(problem)
+    start = problem.initial_state
+
+    path = [start]
+    # States on the path plus nogoods; both are excluded from every domain
+    excluded = {start}
+    yield Expansion(start, 0, 0)
+
+    if problem.is_goal(start):
+        return path
+
+    # One iterator over the remaining domain values per assigned variable
+    candidates = [_domain(index, start, excluded, forward_checking, mrv)]
+
+    while candidates:
+        next_state = next(candidates[-1], None)
+
+        if next_state is None:
+            # Domain exhausted: backtrack, keeping the state as a nogood
+            candidates.pop()
+            path.pop()
+            continue
+
+        if next_state in excluded:
+            continue  # Became a nogood after this domain was computed
+
+        excluded.add(next_state)
+        path.append(next_state)
+        yield Expansion(next_state, len(path) - 1, len(candidates))
+
+        if problem.is_goal(next_state):
+            return path
+
+        candidates.append(_domain(index, next_state, excluded, forward_checking, mrv))
+
+    return []
+
+
+def _domain(index: TransitionIndex, state: State, excluded: Set[State],
+            forward_checking: bool, mrv: bool) -> Iterator[State]:
+    """
+    Values for the variable after `state`: its precomputed successors minus
+    the excluded states. With forward checking, a goal successor is taken
+    straight away and successors left with an empty domain are pruned and
+    recorded as nogoods.
+    """
+    values: List[State] = [s for s in index.successors(state) if s not in excluded]
+    if not forward_checking and not mrv:
+        return iter(values)
+
+    remaining: Optional[List[int]] = [] if mrv else None
+    live = []
+    for value in values:
+        if forward_checking and index.problem.is_goal(value):
+            return iter([value])
+        open_values = sum(1 for s in index.successors(value) if s not in excluded)
+        if forward_checking and not open_values:
+            excluded.add(value)
+            continue
+        live.append(value)
+        if remaining is not None:
+            remaining.append(open_values)
 
+    if remaining is not None:
+        live = [value for _, _, value in sorted(zip(remaining, range(len(live)), live))]
+    return iter(live)
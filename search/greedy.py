@@ -1,42 +1,114 @@
-from typing import Tuple, List
+from typing import Dict, Iterator, Optional
 import time
 import heapq
+import math
 
-from core.river_crossing import INITIAL_STATE, GOAL_STATE, is_goal, get_successors, heuristic
+from core.river_crossing import DEFAULT_PROBLEM, Problem, State
+from core.events import Expansion, run_events
+from core.frontier import BucketQueue, check_frontier, integer_key
+from core.heuristics import get_heuristic
+from core.index import get_index
+from core.paths import reconstruct
 
-def solve():
+def solve(problem: Optional[Problem] = None, heuristic: str = "simple", frontier: str = "heap"):
     """
     Solve the Missionaries and Cannibals problem using Greedy Best-First Search.
 
+    Args:
+        problem: Instance to solve (defaults to the classic 3/3/2 instance).
+        heuristic: Name of the heuristic to use (see core.heuristics.HEURISTICS).
+        frontier: "heap" (binary heap) or "bucket" (core.frontier.BucketQueue
+            keyed by h * capacity).
+
     Returns:
-        tuple: (nodes_explored, path, time_sec)
+        tuple: (path, nodes_explored, time_ms)
+            - path: A list of states representing the path from the initial state to the goal state.
             - nodes_explored: The number of nodes explored during the search.
-            - path: A list of states representing the path from INITIAL_STATE to GOAL_STATE.
-            - time_sec: The execution time in seconds.
+            - time_ms: The execution time in milliseconds.
     """
-    start_time = time.time()
+    problem = problem or DEFAULT_PROBLEM
+    check_frontier(frontier)
+    if frontier == "bucket":
+        return _solve_bucket(problem, heuristic)
+    start_time = time.perf_counter()
+    path, nodes_explored = run_events(search_iter(problem, heuristic))
+    return path, nodes_explored, (time.perf_counter() - start_time) * 1000
 
-    priority_queue = [(heuristic(INITIAL_STATE), INITIAL_STATE, [INITIAL_STATE])]
-    visited = set()
-    nodes_explored = 0
+
+def search_iter(problem: Optional[Problem] = None, heuristic: str = "simple") -> Iterator[Expansion]:
+    """
+    Greedy Best-First Search that yields an Expansion for every expanded
+    state and returns the solution path (or []) when it stops.
+    """
+    problem = problem or DEFAULT_PROBLEM
+    h = get_heuristic(problem, heuristic)
+    index = get_index(problem)
+
+    # Heap entries carry the state that pushed them rather than a copy of
+    # the path; the parent pointer is recorded when a state is expanded
+    start = problem.initial_state
+    priority_queue = [(h(start), start, None)]
+    came_from: Dict[State, Optional[State]] = {}
+    depths: Dict[State, int] = {}
 
     while priority_queue:
-        h_val, current_state, path = heapq.heappop(priority_queue)
+        h_val, current_state, parent = heapq.heappop(priority_queue)
 
-        if current_state in visited:
+        if current_state in came_from:
             continue
 
-        visited.add(current_state)
+        came_from[current_state] = parent
+        depths[current_state] = 0 if parent is None else depths[parent] + 1
+        yield Expansion(current_state, depths[current_state], len(priority_queue))
+
+        if problem.is_goal(current_state):
+            return reconstruct(came_from, current_state)
+
+        for next_state in index.successors(current_state):
+            if next_state not in came_from:
+                h_next = h(next_state)
+                if h_next == math.inf:
+                    continue  # Heuristic proves the goal unreachable from here
+                heapq.heappush(priority_queue, (h_next, next_state, current_state))
+
+    return []
+
+
+def _solve_bucket(problem: Problem, heuristic: str):
+    """
+    Greedy search over a BucketQueue keyed by h * capacity; among equal keys the
+    most recently pushed state goes first. A state's key never changes, so
+    it is queued once and its parent is recorded when it is first reached.
+    """
+    start_time = time.perf_counter()
+    h = get_heuristic(problem, heuristic)
+    index = get_index(problem)
+
+    start = problem.initial_state
+    open_queue = BucketQueue()
+    came_from: Dict[State, Optional[State]] = {start: None}
+    scale = problem.boat_capacity
+    h_start = h(start)
+    if h_start != math.inf:
+        open_queue.push(start, integer_key(h_start, scale))
+    nodes_explored = 0
+
+    while open_queue:
+        current_state, _, _ = open_queue.pop()
         nodes_explored += 1
 
-        if is_goal(current_state):
-            end_time = time.time()
+        if problem.is_goal(current_state):
+            path = reconstruct(came_from, current_state)
+            end_time = time.perf_counter()
             return path, nodes_explored, (end_time - start_time) * 1000
 
-        for next_state in get_successors(current_state):
-            if next_state not in visited:
-                new_path = path + [next_state]
-                heapq.heappush(priority_queue, (heuristic(next_state), next_state, new_path))
+        for next_state in index.successors(current_state):
+            if next_state not in came_from:
+                h_next = h(next_state)
+                if h_next == math.inf:
+                    continue
+                came_from[next_state] = current_state
+                open_queue.push(next_state, integer_key(h_next, scale))
 
-    end_time = time.time()
-    return [], nodes_explored, (end_time - start_time) * 1000  # No solution found
\ No newline at end of file
+    end_time = time.perf_counter()
+    return [], nodes_explored, (end_time - start_time) * 1000  # No solution found
@@ -0,0 +1,184 @@
+"""
+Iterative Deepening A* (IDA*) for the River Crossing Problem.
+
+IDA* runs a series of depth-first searches bounded by f = g + h, raising the
+bound to the smallest f that exceeded it on the previous pass. Memory is
+O(depth): only the current path and one successor iterator per level are
+kept, plus a transposition table capped at `tt_size` entries that prunes
+states already reached more cheaply during the current pass.
+
+Use `max_nodes` to cap the total number of expansions; when the budget runs
+out the solver gives up and returns an empty path.
+"""
+
+from typing import Callable, Iterator, List, Optional, Tuple
+import math
+import time
+
+from core.river_crossing import DEFAULT_PROBLEM, Problem, State
+from core.events import Expansion, run_events
+from core.heuristics import get_heuristic
+from core.index import TransitionIndex, get_index
+
+DEFAULT_TT_SIZE = 100_000
+
+
+def solve(problem: Optional[Problem] = None,
+          max_nodes: Optional[int] = None,
+          tt_size: int = DEFAULT_TT_SIZE,
+          heuristic: str = "simple") -> Tuple[List[State], int, float]:
+    """
+    Solve the Missionaries and Cannibals problem using IDA*.
+
+    Args:
+        problem: Instance to solve (defaults to the classic 3/3/2 instance).
+        max_nodes: Optional expansion budget across all iterations.
+        tt_size: Maximum number of transposition-table entries.
+        heuristic: Name of the heuristic to use (see core.heuristics.HEURISTICS).
+
+    Returns:
+        tuple: (path, nodes_explored, time_ms)
+    """
+    problem = problem or DEFAULT_PROBLEM
+    start_time = time.perf_counter()
+    h = get_heuristic(problem, heuristic)
+    index = get_index(problem)
+
+    bound = h(problem.initial_state)
+    if bound != math.inf:
+        bound = math.ceil(bound)
+    path, nodes_explored = iterative_deepening(index, h, bound, max_nodes, tt_size)
+
+    elapsed_ms = (time.perf_counter() - start_time) * 1000.0
+    return path, nodes_explored, elapsed_ms
+
+
+def search_iter(problem: Optional[Problem] = None,
+                max_nodes: Optional[int] = None,
+                tt_size: int = DEFAULT_TT_SIZE,
+                heuristic: str = "simple") -> Iterator[Expansion]:
+    """
+    IDA* that yields an Expansion for every expansion of every pass and
+    returns the solution path (or []) when it stops. Same arguments and
+    expansion order as `solve`.
+    """
+    problem = problem or DEFAULT_PROBLEM
+    h = get_heuristic(problem, heuristic)
+    index = get_index(problem)
+
+    bound = h(problem.initial_state)
+    if bound != math.inf:
+        bound = math.ceil(bound)
+    return (yield from iterative_deepening_iter(index, h, bound, max_nodes, tt_size))
+
+
+def iterative_deepening(index: TransitionIndex, heuristic: Callable[[State], float], bound: float,
+                        max_nodes: Optional[int], tt_size: int) -> Tuple[List[State], int]:
+    """
+    Run bounded depth-first passes with growing bounds until the goal is
+    found, the space is exhausted (no pruned f left) or the budget runs out.
+
+    Shared by IDA* and IDDFS (which uses h = 0, so the bound is the depth).
+
+    Returns:
+        tuple: (path or [], nodes_explored)
+    """
+    return run_events(iterative_deepening_iter(index, heuristic, bound, max_nodes, tt_size))
+
+
+def iterative_deepening_iter(index: TransitionIndex, heuristic: Callable[[State], float], bound: float,
+                             max_nodes: Optional[int], tt_size: int) -> Iterator[Expansion]:
+    """
+    Generator form of `iterative_deepening`: yields an Expansion per expanded
+    state (frontier_size is the number of open levels) and returns the path
+    or [].
+    """
+    nodes_explored = 0
+
+    while True:
+        budget = None if max_nodes is None else max_nodes - nodes_explored
+        path, next_bound, expanded = yield from _bounded_search_iter(index, heuristic, bound, budget, tt_size)
+        nodes_explored += expanded
+
+        if path is not None:
+            return path
+        if next_bound == math.inf:
+            return []  # No solution, or budget exhausted
+        # Path costs are integers, so fractional bounds only add empty passes
+        bound = math.ceil(next_bound)
+
+
+def _bounded_search_iter(index: TransitionIndex, heuristic: Callable[[State], float], bound: float,
+                         budget: Optional[int], tt_size: int) -> Iterator[Expansion]:
+    """
+    One depth-first pass from the initial state, pruning nodes with
+    g + h > bound. Yields an Expansion per expanded state. Runs on an
+    explicit stack, so deep instances never touch the recursion limit.
+
+    Returns:
+        tuple: (path or None, next_bound, nodes_expanded)
+            next_bound is the smallest pruned f-value, or inf if nothing was
+            pruned or the budget ran out.
+    """
+    problem = index.problem
+    start = problem.initial_state
+
+    start_f = heuristic(start)
+    if start_f > bound:
+        return None, start_f, 0
+    if budget is not None and budget <= 0:
+        return None, math.inf, 0
+
+    path = [start]
+    on_path = {start}
+    successor_stack = [iter(index.successors(start))]
+    # state -> smallest g at which it was expanded during this pass
+    transpositions = {start: 0}
+
+    nodes_expanded = 1
+    next_bound = math.inf
+    yield Expansion(start, 0, 0)
+
+    if problem.is_goal(start):
+        return path, next_bound, nodes_expanded
+
+    while successor_stack:
+        next_state = next(successor_stack[-1], None)
+
+        if next_state is None:
+            # Level exhausted: backtrack
+            successor_stack.pop()
+            on_path.remove(path.pop())
+            continue
+
+        if next_state in on_path:
+            continue
+
+        g = len(path)
+        f = g + heuristic(next_state)
+        if f > bound:
+            if f < next_bound:
+                next_bound = f
+            continue
+
+        seen_g = transpositions.get(next_state)
+        if seen_g is not None and seen_g <= g:
+            continue
+
+        if budget is not None and nodes_expanded >= budget:
+            return None, math.inf, nodes_expanded
+
+        if seen_g is not None or len(transpositions) < tt_size:
+            transpositions[next_state] = g
+
+        nodes_expanded += 1
+        path.append(next_state)
+        on_path.add(next_state)
+        yield Expansion(next_state, g, len(successor_stack))
+
+        if problem.is_goal(next_state):
+            return path, next_bound, nodes_expanded
+
+        successor_stack.append(iter(index.successors(next_state)))
+
+    return None, next_bound, nodes_expanded
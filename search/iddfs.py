@@ -0,0 +1,56 @@
+"""
+Iterative Deepening Depth-First Search (IDDFS) for the River Crossing Problem.
+
+Runs depth-limited DFS passes with limits 0, 1, 2, ... until the goal is
+found. It is IDA* with a zero heuristic, so it shares the explicit-stack
+bounded search from `search.idastar`. Memory stays O(depth) plus a
+transposition table capped at `tt_size` entries.
+"""
+
+from typing import Iterator, List, Optional, Tuple
+import time
+
+from core.river_crossing import DEFAULT_PROBLEM, Problem, State
+from core.events import Expansion
+from core.index import get_index
+from search.idastar import DEFAULT_TT_SIZE, iterative_deepening, iterative_deepening_iter
+
+
+def _no_heuristic(state: State) -> int:
+    return 0
+
+
+def solve(problem: Optional[Problem] = None,
+          max_nodes: Optional[int] = None,
+          tt_size: int = DEFAULT_TT_SIZE) -> Tuple[List[State], int, float]:
+    """
+    Solve the Missionaries and Cannibals problem using IDDFS.
+
+    Args:
+        problem: Instance to solve (defaults to the classic 3/3/2 instance).
+        max_nodes: Optional expansion budget across all iterations.
+        tt_size: Maximum number of transposition-table entries.
+
+    Returns:
+        tuple: (path, nodes_explored, time_ms)
+    """
+    problem = problem or DEFAULT_PROBLEM
+    start_time = time.perf_counter()
+    index = get_index(problem)
+
+    path, nodes_explored = iterative_deepening(index, _no_heuristic, 0, max_nodes, tt_size)
+
+    elapsed_ms = (time.perf_counter() - start_time) * 1000.0
+    return path, nodes_explored, elapsed_ms
+
+
+def search_iter(problem: Optional[Problem] = None,
+                max_nodes: Optional[int] = None,
+                tt_size: int = DEFAULT_TT_SIZE) -> Iterator[Expansion]:
+    """
+    IDDFS that yields an Expansion for every expansion of every pass and
+    returns the solution path (or []) when it stops.
+    """
+    problem = problem or DEFAULT_PROBLEM
+    index = get_index(problem)
+    return (yield from iterative_deepening_iter(index, _no_heuristic, 0, max_nodes, tt_size))
@@ -0,0 +1,121 @@
+# search/registry.py
+"""
+Registry of the search algorithms, keyed by display name.
+
+Solver modules are imported on first use, so entry points that list the
+algorithms or run just one of them do not pay for loading all of them (and
+their heuristics). `LazySolver` pickles as plain data (module name and
+heuristic), so `core.parallel` can ship it to worker processes without the
+parent ever importing the solver.
+"""
+
+import argparse
+from importlib import import_module
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from core.river_crossing import Problem
+
+# Display name -> module defining solve() and search_iter()
+SOLVER_MODULES = {
+    "BFS": "search.bfs",
+    "DFS": "search.dfs",
+    "A*": "search.astar",
+    "Greedy": "search.greedy",
+    "CSP": "search.csp",
+    "Bidirectional": "search.bidirectional",
+    "IDA*": "search.idastar",
+    "IDDFS": "search.iddfs",
+    "Weighted A*": "search.weighted_astar",
+    "ARA*": "search.ara_star",
+    "Beam": "search.beam",
+}
+
+# The algorithms compared by main.py and the GUI
+DEFAULT_ALGORITHMS = ("BFS", "DFS", "A*", "Greedy", "CSP", "Bidirectional")
+
+# Algorithms that accept a heuristic= argument
+HEURISTIC_ALGORITHMS = frozenset({"A*", "Greedy", "IDA*", "Weighted A*", "ARA*", "Beam"})
+
+# Names accepted by heuristic=; mirrors core.heuristics.HEURISTICS, which
+# is not imported here so the CLIs can validate flags without loading it
+HEURISTIC_NAMES = ("simple", "capacity", "pdb")
+
+# Quality/latency knobs accepted by each algorithm's solve()
+SOLVER_OPTIONS = {
+    "A*": frozenset({"frontier"}),
+    "Greedy": frozenset({"frontier"}),
+    "Weighted A*": frozenset({"weight", "time_limit"}),
+    "ARA*": frozenset({"weight", "weight_step", "time_limit"}),
+    "Beam": frozenset({"width", "time_limit"}),
+}
+
+
+class LazySolver(NamedTuple):
+    """
+    A module's `solve`, imported when first called, with an optional
+    heuristic and extra keyword options (as sorted (name, value) pairs).
+    """
+
+    module: str
+    heuristic: Optional[str] = None
+    options: Tuple[Tuple[str, Any], ...] = ()
+
+    def __call__(self, *args, **kwargs):
+        if self.heuristic is not None:
+            kwargs.setdefault("heuristic", self.heuristic)
+        for name, value in self.options:
+            kwargs.setdefault(name, value)
+        return import_module(self.module).solve(*args, **kwargs)
+
+    def load(self):
+        """Import the module now and return its plain `solve` function."""
+        return import_module(self.module).solve
+
+
+def _module_name(name: str) -> str:
+    try:
+        return SOLVER_MODULES[name]
+    except KeyError:
+        raise KeyError(f"unknown algorithm '{name}' (expected one of {', '.join(SOLVER_MODULES)})") from None
+
+
+def get_solver(name: str, heuristic: Optional[str] = None, **options) -> LazySolver:
+    """
+    solve(problem=None, ...) -> (path, nodes, time_ms) for `name`, with
+    `heuristic` and `options` (see SOLVER_OPTIONS) bound.
+    """
+    if heuristic is not None and name not in HEURISTIC_ALGORITHMS:
+        raise ValueError(f"{name} does not take a heuristic")
+    unknown = set(options) - SOLVER_OPTIONS.get(name, frozenset())
+    if unknown:
+        raise ValueError(f"{name} does not take {', '.join(sorted(unknown))}")
+    return LazySolver(_module_name(name), heuristic, tuple(sorted(options.items())))
+
+
+def get_search_iter(name: str):
+    """The `search_iter` generator function for `name` (imports its module)."""
+    return import_module(_module_name(name)).search_iter
+
+
+def solvers(names: Iterable[str] = DEFAULT_ALGORITHMS, heuristic: Optional[str] = None,
+            **options) -> Dict[str, LazySolver]:
+    """
+    Name -> lazy solver mapping, in the order given. `heuristic` and each
+    of `options` apply to the algorithms that accept them; the others
+    ignore them.
+    """
+    selected = {}
+    for name in names:
+        accepted = SOLVER_OPTIONS.get(name, frozenset())
+        selected[name] = get_solver(name, heuristic if name in HEURISTIC_ALGORITHMS else None,
+                                    **{key: value for key, value in options.items() if key in accepted})
+    return selected
+
+
+def parse_size(text: str) -> Problem:
+    """argparse type for an instance written as M,C,CAPACITY."""
+    try:
+        m, c, capacity = (int(part) for part in text.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected M,C,CAPACITY, got '{text}'")
+    return Problem(m, c, capacity)
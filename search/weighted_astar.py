@@ -0,0 +1,93 @@
+"""
+Weighted A* for the River Crossing Problem.
+
+Orders the open list by f = g + w * h. With w = 1 this is plain A*; larger
+weights trust the heuristic more, expanding far fewer states in exchange
+for solutions that may be up to w times longer than optimal (the heuristic
+is admissible, so the bound holds). Greedy search is the limit w -> inf.
+
+Use `time_limit` to cap the search in seconds; when it passes before a
+solution is found the solver returns an empty path.
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+import heapq
+import math
+import time
+
+from core.river_crossing import DEFAULT_PROBLEM, Problem, State
+from core.events import Expansion, run_events
+from core.heuristics import get_heuristic
+from core.index import get_index
+from core.paths import reconstruct
+
+DEFAULT_WEIGHT = 2.0
+
+
+def solve(problem: Optional[Problem] = None,
+          weight: float = DEFAULT_WEIGHT,
+          heuristic: str = "simple",
+          time_limit: Optional[float] = None) -> Tuple[List[State], int, float]:
+    """
+    Solve the Missionaries and Cannibals problem using Weighted A*.
+
+    Args:
+        problem: Instance to solve (defaults to the classic 3/3/2 instance).
+        weight: Heuristic weight w >= 1; the path is at most w times optimal.
+        heuristic: Name of the heuristic to use (see core.heuristics.HEURISTICS).
+        time_limit: Optional limit in seconds.
+
+    Returns:
+        tuple: (path, nodes_explored, time_ms)
+    """
+    start_time = time.perf_counter()
+    path, nodes_explored = run_events(search_iter(problem, weight, heuristic, time_limit))
+    elapsed_ms = (time.perf_counter() - start_time) * 1000.0
+    return path, nodes_explored, elapsed_ms
+
+
+def search_iter(problem: Optional[Problem] = None,
+                weight: float = DEFAULT_WEIGHT,
+                heuristic: str = "simple",
+                time_limit: Optional[float] = None) -> Iterator[Expansion]:
+    """
+    Weighted A* that yields an Expansion for every closed state (depth = g)
+    and returns the solution path (or []) when it stops.
+    """
+    if weight < 1:
+        raise ValueError("weight must be at least 1")
+    problem = problem or DEFAULT_PROBLEM
+    h = get_heuristic(problem, heuristic)
+    index = get_index(problem)
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+
+    start = problem.initial_state
+    open_heap: List[Tuple[float, float, State]] = [(weight * h(start), h(start), start)]
+    came_from: Dict[State, Optional[State]] = {start: None}
+    g_score: Dict[State, int] = {start: 0}
+    visited = set()
+
+    while open_heap:
+        if deadline is not None and time.perf_counter() > deadline:
+            return []
+
+        _, _, current = heapq.heappop(open_heap)
+        if current in visited:
+            continue
+        visited.add(current)
+        yield Expansion(current, g_score[current], len(open_heap))
+
+        if problem.is_goal(current):
+            return reconstruct(came_from, current)
+
+        tentative_g = g_score[current] + 1
+        for neighbor in index.successors(current):
+            if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                h_neighbor = h(neighbor)
+                if h_neighbor == math.inf:
+                    continue
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                heapq.heappush(open_heap, (tentative_g + weight * h_neighbor, h_neighbor, neighbor))
+
+    return []